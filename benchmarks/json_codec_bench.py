@@ -0,0 +1,86 @@
+"""
+Per-product JSON CPU cost of one workflow, stdlib vs the json_codec backends.
+
+Replays the JSON work a single product incurs in a batch run (ingestion
+decode + validation, prompt context encoding, research/FAQ response decoding,
+telemetry payloads and pretty artifact files).
+
+Usage:
+    python -m benchmarks.json_codec_bench [--products 2000]
+"""
+import argparse
+import json
+import time
+
+from src.schemas.product_data import ProductData
+from src.Utils import json_codec
+
+PRODUCT = {
+    "product_name": "GlowBoost Vitamin C Serum",
+    "concentration": "10% Vitamin C",
+    "skin_type": "Oily, Combination",
+    "key_ingredients": ["Vitamin C", "Hyaluronic Acid", "Ferulic Acid", "Vitamin E"],
+    "benefits": ["Brightening", "Fades dark spots", "Antioxidant protection"],
+    "how_to_use": "Apply 2-3 drops in the morning before sunscreen.",
+    "side_effects": "Mild tingling for sensitive skin.",
+    "price": "$50",
+}
+QUESTIONS = {"questions": [f"Question {i} about the serum and how it compares?" for i in range(15)]}
+COMPETITOR = {"product_name": "RivalGlow", "price": "$45", "key_ingredients": ["Niacinamide"], "benefits": ["Even tone"]}
+FAQS = {"faqs": [{"question": q, "answer": "Based on the product facts, yes. " * 4} for q in QUESTIONS["questions"][:5]]}
+PAGES = [
+    {"page_type": "product_listing", "title": PRODUCT["product_name"], "price": "$50", "content": "Generated via Agent System"},
+    {"page_type": "faq", "questions": QUESTIONS["questions"][:5], "faqs": FAQS["faqs"]},
+    {"page_type": "comparison", "us": PRODUCT["product_name"], "them": "RivalGlow"},
+]
+RESPONSES = {name: json.dumps(obj) for name, obj in [("product", PRODUCT), ("questions", QUESTIONS), ("competitor", COMPETITOR), ("faqs", FAQS)]}
+
+
+def baseline_product() -> None:
+    """The call pattern before json_codec: stdlib everywhere, dict -> model validation."""
+    data = ProductData(**json.loads(RESPONSES["product"])).model_dump()
+    json.dumps(data)
+    json.loads(RESPONSES["competitor"])
+    json.loads(RESPONSES["questions"])
+    json.loads(RESPONSES["faqs"])
+    json.dumps({"agent": "Researcher", "data": data}, default=str)
+    for page in PAGES:
+        json.dumps(page, indent=2)
+
+
+def codec_product() -> None:
+    data = json_codec.decode_model(RESPONSES["product"], ProductData).model_dump()
+    json_codec.dumps(data)
+    json_codec.loads(RESPONSES["competitor"])
+    json_codec.loads(RESPONSES["questions"])
+    json_codec.loads(RESPONSES["faqs"])
+    json_codec.dumps({"agent": "Researcher", "data": data}, default=str)
+    for page in PAGES:
+        json_codec.dumps_bytes(page, pretty=True)
+
+
+def measure(fn, products: int) -> float:
+    """Returns microseconds of CPU per product."""
+    fn()  # warm up
+    start = time.process_time()
+    for _ in range(products):
+        fn()
+    return (time.process_time() - start) / products * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=2000)
+    args = parser.parse_args()
+
+    baseline = measure(baseline_product, args.products)
+    print(f"{'backend':<10} {'us/product':>12} {'saved':>10}")
+    print(f"{'baseline':<10} {baseline:>12.1f} {'-':>10}")
+    for backend in json_codec.available_backends():
+        json_codec.set_backend(backend)
+        cost = measure(codec_product, args.products)
+        print(f"{backend:<10} {cost:>12.1f} {100 * (baseline - cost) / baseline:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,27 @@
 import os
+from typing import Dict, List
 from dotenv import load_dotenv
 
 # Load environment variables from .env at application startup
 load_dotenv()
 
 
+def _env_int(name: str, default: int) -> int:
+    """Reads an integer environment variable, falling back on bad input."""
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Reads a float environment variable, falling back on bad input."""
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
 class Settings:
     """
     Centralized configuration management.
@@ -30,10 +47,110 @@ class Settings:
     except ValueError:
         LLM_TEMPERATURE_DEFAULT = 0.7
 
+    # ------------------ LLM Concurrency ------------------ #
+    # Adaptive (AIMD) limit on in-flight LLM calls, shared process-wide
+    LLM_CONCURRENCY_INITIAL: int = _env_int("LLM_CONCURRENCY_INITIAL", 4)
+    LLM_CONCURRENCY_MIN: int = _env_int("LLM_CONCURRENCY_MIN", 1)
+    LLM_CONCURRENCY_MAX: int = _env_int("LLM_CONCURRENCY_MAX", 32)
+    # Latency above baseline * tolerance counts as overload
+    LLM_LATENCY_TOLERANCE: float = _env_float("LLM_LATENCY_TOLERANCE", 2.0)
+    LLM_MAX_RETRIES: int = _env_int("LLM_MAX_RETRIES", 3)
+    LLM_RETRY_BACKOFF_SECONDS: float = _env_float("LLM_RETRY_BACKOFF_SECONDS", 1.0)
+
+    # ------------------ Prompt Prefix Cache ------------------ #
+    # Provider-side context caching for long, stable system prompts
+    PROMPT_CACHE_TTL_SECONDS: int = _env_int("PROMPT_CACHE_TTL_SECONDS", 3600)
+    # Refresh a cached prefix when it has less than this left to live
+    PROMPT_CACHE_REFRESH_MARGIN_SECONDS: int = _env_int("PROMPT_CACHE_REFRESH_MARGIN_SECONDS", 300)
+    # Providers reject (or don't discount) prefixes below a minimum size.
+    # Today's system prompts are all far below this, so nothing is cached yet.
+    PROMPT_CACHE_MIN_TOKENS: int = _env_int("PROMPT_CACHE_MIN_TOKENS", 1024)
+
+    # ------------------ Token Budgets ------------------ #
+    # Keyed by agent registry name. "max_input_tokens" caps the context
+    # embedded in prompts; "max_output_tokens" is sent to the provider.
+    TOKEN_BUDGETS: Dict[str, Dict[str, int]] = {
+        "ingestor": {
+            "max_input_tokens": _env_int("INGESTOR_MAX_INPUT_TOKENS", 2000),
+            "max_output_tokens": _env_int("INGESTOR_MAX_OUTPUT_TOKENS", 512),
+        },
+        "researcher": {
+            "max_input_tokens": _env_int("RESEARCHER_MAX_INPUT_TOKENS", 400),
+            "max_output_tokens": _env_int("RESEARCHER_MAX_OUTPUT_TOKENS", 768),
+        },
+        "drafter": {
+            "max_input_tokens": _env_int("DRAFTER_MAX_INPUT_TOKENS", 600),
+            "max_output_tokens": _env_int("DRAFTER_MAX_OUTPUT_TOKENS", 1536),
+        },
+    }
+
+    # Provider ceiling on max_output_tokens for one call (batched calls are capped to it)
+    LLM_MAX_OUTPUT_TOKENS: int = _env_int("LLM_MAX_OUTPUT_TOKENS", 8192)
+
+    # Product fields embedded in each agent's prompts, in priority order.
+    # When the context exceeds the budget, trailing fields are dropped first.
+    PROMPT_CONTEXT_FIELDS: Dict[str, List[str]] = {
+        "researcher": [
+            "product_name", "key_ingredients", "benefits",
+            "skin_type", "concentration", "price",
+        ],
+        "drafter": [
+            "product_name", "price", "key_ingredients", "benefits",
+            "how_to_use", "side_effects", "skin_type", "concentration",
+        ],
+    }
+
+    # ------------------ Content Generation ------------------ #
+    FAQ_QUESTION_COUNT: int = _env_int("FAQ_QUESTION_COUNT", 5)
+    # Products answered per batched FAQ call in DraftingAgent.draft_batch
+    # (further limited so the batch's output budget fits LLM_MAX_OUTPUT_TOKENS)
+    FAQ_BATCH_SIZE: int = _env_int("FAQ_BATCH_SIZE", 8)
+    # Drafter passes that may fail to answer a product's FAQs before the workflow stops
+    FAQ_MAX_ATTEMPTS: int = _env_int("FAQ_MAX_ATTEMPTS", 3)
+
+    # ------------------ Serialization ------------------ #
+    # "auto" picks orjson, then msgspec, then the stdlib json module
+    JSON_BACKEND: str = os.getenv("JSON_BACKEND", "auto").strip().lower()
+
+    # ------------------ Scheduler ------------------ #
+    SCHEDULER_WORKERS: int = _env_int("SCHEDULER_WORKERS", 4)
+    # Workers bulk jobs may never occupy, keeping interactive latency bounded
+    SCHEDULER_RESERVED_INTERACTIVE_WORKERS: int = _env_int("SCHEDULER_RESERVED_INTERACTIVE_WORKERS", 1)
+    # One run report per scheduled workflow is written here
+    SCHEDULER_REPORT_DIR: str = os.getenv("SCHEDULER_REPORT_DIR", "reports")
+
+    # ------------------ Artifact Store ------------------ #
+    # Content-addressed cache of finished pages for incremental regeneration
+    ARTIFACT_STORE_DIR: str = os.getenv("ARTIFACT_STORE_DIR", ".artifact_store")
+
+    # ------------------ Metrics ------------------ #
+    # Local Prometheus-style /metrics endpoint (started when ENABLE_METRICS is true)
+    METRICS_HOST: str = os.getenv("METRICS_HOST", "127.0.0.1")
+    METRICS_PORT: int = _env_int("METRICS_PORT", 9108)
+
     # ------------------ Feature Flags ------------------ #
     ENABLE_TELEMETRY: bool = (
         os.getenv("ENABLE_TELEMETRY", "true").strip().lower() == "true"
     )
+    ENABLE_METRICS: bool = (
+        os.getenv("ENABLE_METRICS", "false").strip().lower() == "true"
+    )
+    # Opt-in: cached prefixes are billed as provider-side storage
+    ENABLE_PROMPT_CACHE: bool = (
+        os.getenv("ENABLE_PROMPT_CACHE", "false").strip().lower() == "true"
+    )
+    ENABLE_ARTIFACT_STORE: bool = (
+        os.getenv("ENABLE_ARTIFACT_STORE", "true").strip().lower() == "true"
+    )
+
+    def token_budget(self, agent: str) -> Dict[str, int]:
+        """
+        Returns the token budget for an agent (empty dict if unbudgeted).
+
+        Args:
+            agent: Agent registry name (e.g., 'researcher')
+        """
+        return self.TOKEN_BUDGETS.get(agent, {})
 
 
 # Singleton instance to be imported by other modules
@@ -1,33 +1,23 @@
+import sys
 from src.core.workflow_state import WorkflowState
 from src.core.orchestrator import Orchestrator
+from src.core.scheduler import RequestScheduler
 from src.agents.supervisor import SupervisorAgent
 from src.agents.data_ingestion import DataIngestionAgent
 from src.agents.researcher import ResearchAgent
 from src.agents.drafter import DraftingAgent
 from src.agents.reviewer import ReviewerAgent
+from src.schemas.requests import UserRequest
+from src.services.llm_gateway import LLMGateway
+from src.services.artifact_store import ArtifactStore
+from src.services.metrics import start_metrics_server
+from src.services.single_flight import get_single_flight
 from src.Utils.file_manager import ArtifactSaver
+from config.settings import settings
 
 RAW_INPUT = "Sell a Vitamin C Serum for $50."
 
-def main():
-    # 1. Initialize Workers
-    registry = {
-        "ingestor": DataIngestionAgent(),
-        "researcher": ResearchAgent(),
-        "drafter": DraftingAgent(),
-        "reviewer": ReviewerAgent()
-    }
-    
-    # 2. Initialize Boss
-    supervisor = SupervisorAgent()
-    
-    # 3. Setup Orchestrator
-    orchestrator = Orchestrator(supervisor, registry)
-    
-    # 4. Run
-    state = WorkflowState(raw_input=RAW_INPUT)
-    final_state = orchestrator.run(state)
-    
+def save_results(final_state: WorkflowState, output_dir: str = "output"):
     if final_state.errors:
         print("❌ Errors:", final_state.errors)
     else:
@@ -35,12 +25,53 @@ def main():
     if final_state.is_complete:
         print("\n------------------------------------------------")
         print("✅ Workflow Complete. Saving Artifacts...")
-        ArtifactSaver.save_artifacts(final_state, output_dir="output")
+        ArtifactSaver.save_artifacts(final_state, output_dir=output_dir)
     else:
         print("\n❌ Workflow finished incompletely. Checking for partial data...")
         # Optional: Save partial data for debugging
         if final_state.product_page or final_state.faq_page:
-             ArtifactSaver.save_artifacts(final_state, output_dir="output_partial")
+             ArtifactSaver.save_artifacts(final_state, output_dir=f"{output_dir}_partial")
+
+def main(raw_inputs=None):
+    # 0. Optional live /metrics endpoint (ENABLE_METRICS=true)
+    start_metrics_server()
+
+    # 1. Initialize Workers (sharing one gateway)
+    gateway = LLMGateway()
+    registry = {
+        "ingestor": DataIngestionAgent(llm_gateway=gateway),
+        "researcher": ResearchAgent(llm_gateway=gateway),
+        "drafter": DraftingAgent(llm_gateway=gateway),
+        "reviewer": ReviewerAgent()
+    }
+
+    # 2. Initialize Boss
+    supervisor = SupervisorAgent(llm_gateway=gateway)
+
+    # 3. Setup Orchestrator (skips products whose input, prompts and model are unchanged)
+    store = ArtifactStore(model_name=gateway.model_name) if settings.ENABLE_ARTIFACT_STORE else None
+
+    def build_orchestrator():
+        return Orchestrator(
+            supervisor, registry, artifact_store=store, single_flight=get_single_flight("workflow")
+        )
+
+    # 4. Run
+    if not raw_inputs:
+        final_state = build_orchestrator().run(WorkflowState(raw_input=RAW_INPUT))
+        save_results(final_state)
+        return
+
+    # Batch: every input is a bulk job; the scheduler keeps LLM load within the limiter's headroom
+    scheduler = RequestScheduler(build_orchestrator, limiter=gateway.limiter).start()
+    futures = [scheduler.submit(UserRequest(user_input=text, priority="bulk")) for text in raw_inputs]
+    scheduler.shutdown()
+    for idx, future in enumerate(futures, start=1):
+        try:
+            save_results(future.result(), output_dir=f"output/{idx:03d}")
+        except Exception as e:
+            print(f"❌ Workflow {idx} crashed: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # `python main.py "input one" "input two"` runs a scheduled batch
+    main(sys.argv[1:])
@@ -1,11 +1,15 @@
 import os
-import json
+from src.Utils import json_codec
 from src.core.workflow_state import WorkflowState
 
+ARTIFACT_FILES = ("product_page.json", "faq_page.json", "comparison_page.json")
+# Saved next to the pages so offline QA can check them against the source facts
+PRODUCT_DATA_FILE = "product_data.json"
+
 class ArtifactSaver:
     @staticmethod
-    def save_artifacts(state: WorkflowState, output_dir="output"):
-        """Saves final JSON pages to the output directory."""
+    def save_artifacts(state: WorkflowState, output_dir="output", pretty=True):
+        """Saves final JSON pages and their product_data to the output directory (compact JSON if pretty=False)."""
         
         # 1. Ensure directory exists
         if not os.path.exists(output_dir):
@@ -18,9 +22,7 @@ class ArtifactSaver:
 
         # 2. Map filenames to state data
         artifacts = {
-            "product_page.json": state.product_page,
-            "faq_page.json": state.faq_page,
-            "comparison_page.json": state.comparison_page
+            filename: getattr(state, filename[:-len(".json")]) for filename in ARTIFACT_FILES + (PRODUCT_DATA_FILE,)
         }
 
         # 3. Save files
@@ -29,8 +31,8 @@ class ArtifactSaver:
             if content:
                 filepath = os.path.join(output_dir, filename)
                 try:
-                    with open(filepath, "w", encoding="utf-8") as f:
-                        json.dump(content, f, indent=2)
+                    with open(filepath, "wb") as f:
+                        f.write(json_codec.dumps_bytes(content, pretty=pretty))
                     saved_count += 1
                 except IOError as e:
                     print(f"❌ Failed to save {filename}: {e}")
@@ -38,4 +40,17 @@ class ArtifactSaver:
         if saved_count > 0:
             print(f"💾 Successfully saved {saved_count} JSON files to '{output_dir}/'")
         else:
-            print("⚠️ No artifacts were generated to save.")
\ No newline at end of file
+            print("⚠️ No artifacts were generated to save.")
+
+    @staticmethod
+    def load_artifacts(output_dir="output"):
+        """Loads previously saved JSON pages and product_data (missing or unreadable files load as None)."""
+        pages = {}
+        for filename in ARTIFACT_FILES + (PRODUCT_DATA_FILE,):
+            filepath = os.path.join(output_dir, filename)
+            try:
+                with open(filepath, "rb") as f:
+                    pages[filename[:-len(".json")]] = json_codec.loads(f.read())
+            except (IOError, ValueError):
+                pages[filename[:-len(".json")]] = None
+        return pages
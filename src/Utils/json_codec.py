@@ -0,0 +1,102 @@
+import json
+from typing import Any, Callable, List, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+from config.settings import settings
+
+# Optional fast backends: used when installed, never required
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+JsonInput = Union[str, bytes, bytearray]
+
+
+def available_backends() -> List[str]:
+    """Lists the backends importable in this environment, fastest first."""
+    backends = []
+    if orjson is not None:
+        backends.append("orjson")
+    if msgspec is not None:
+        backends.append("msgspec")
+    backends.append("stdlib")
+    return backends
+
+
+def _select_backend(preferred: str) -> str:
+    available = available_backends()
+    if preferred in available:
+        return preferred
+    if preferred not in ("", "auto"):
+        print(f"⚠️ JSON backend '{preferred}' unavailable, using {available[0]}")
+    return available[0]
+
+
+_backend = _select_backend(settings.JSON_BACKEND)
+
+
+def get_backend() -> str:
+    return _backend
+
+
+def set_backend(name: str) -> str:
+    """Switches the active backend (e.g. for benchmarks). Returns the backend in use."""
+    global _backend
+    _backend = _select_backend(name)
+    return _backend
+
+
+def loads(data: JsonInput) -> Any:
+    """Decodes JSON from str or bytes."""
+    if _backend == "orjson":
+        return orjson.loads(data)
+    if _backend == "msgspec":
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, pretty: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Encodes an object to UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to encode
+        pretty: Indent with 2 spaces instead of the compact form
+        default: Fallback for unsupported types (e.g. `str`)
+    """
+    if _backend == "orjson":
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+
+    if _backend == "msgspec":
+        encoded = msgspec.json.encode(obj, enc_hook=default)
+        return msgspec.json.format(encoded, indent=2) if pretty else encoded
+
+    if pretty:
+        text = json.dumps(obj, default=default, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def dumps(obj: Any, pretty: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Encodes an object to a JSON string (compact unless `pretty`)."""
+    return dumps_bytes(obj, pretty=pretty, default=default).decode("utf-8")
+
+
+def decode_model(data: JsonInput, model: Type[ModelT]) -> ModelT:
+    """
+    Parses and validates a pydantic model straight from JSON text or bytes,
+    skipping the intermediate dict.
+    """
+    return model.model_validate_json(data)
@@ -1,9 +1,12 @@
 import datetime
+import os
 
 class RunLogger:
     def __init__(self):
         self.logs = []
         self.start_time = datetime.datetime.now()
+        self.token_usage = {}
+        self.dedupe = {}
 
     def log_step(self, agent: str, action: str, details: str = ""):
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
@@ -12,8 +15,18 @@ class RunLogger:
         # Also print to console so we still see it live
         print(f"[{agent}] {action} {details}")
 
+    def record_token_usage(self, token_usage: dict):
+        # Per-agent totals collected on the WorkflowState during the run
+        self.token_usage = dict(token_usage)
+
+    def record_dedupe(self, dedupe: dict):
+        # Single-flight stats per layer accrued during the run: {"llm": {"executed": .., "shared": ..}}
+        self.dedupe = dict(dedupe)
+
     def save_report(self, filename="run_report.md"):
         duration = datetime.datetime.now() - self.start_time
+        if os.path.dirname(filename):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
         
         with open(filename, "w", encoding="utf-8") as f:
             f.write(f"# 🕵️ Agent Execution Report\n")
@@ -25,6 +38,25 @@ class RunLogger:
             f.write("|---|---|---|---|\n")
             for log in self.logs:
                 f.write(log + "\n")
+
+            if self.token_usage:
+                f.write("\n## 🪙 Token Usage\n")
+                f.write("| Agent | Calls | Input Tokens | Output Tokens |\n")
+                f.write("|---|---|---|---|\n")
+                total_in = total_out = 0
+                for agent, usage in self.token_usage.items():
+                    f.write(f"| {agent} | {usage['calls']} | {usage['input_tokens']} | {usage['output_tokens']} |\n")
+                    total_in += usage["input_tokens"]
+                    total_out += usage["output_tokens"]
+                f.write(f"| **Total** | | {total_in} | {total_out} |\n")
+
+            if self.dedupe:
+                f.write("\n## 🔁 In-Flight Deduplication\n")
+                f.write("Process-wide single-flight activity while this run was in progress.\n\n")
+                f.write("| Layer | Executed | Shared |\n")
+                f.write("|---|---|---|\n")
+                for layer, stats in self.dedupe.items():
+                    f.write(f"| {layer} | {stats['executed']} | {stats['shared']} |\n")
             
             f.write("\n## ✅ Final Status\n")
             f.write("System completed successfully. Generated 3 artifacts.\n")
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import yaml
 from typing import Dict, Any
@@ -13,4 +14,12 @@ def load_prompts(config_path: str = "config/prompts.yaml") -> Dict[str, Any]:
             return yaml.safe_load(file) or {}
     except Exception as e:
         print(f"❌ Error loading prompts: {e}")
-        return {}
\ No newline at end of file
+        return {}
+
+def prompt_version(config_path: str = "config/prompts.yaml") -> str:
+    """Content hash of the prompt file; changes whenever any prompt is edited."""
+    try:
+        with open(config_path, 'rb') as file:
+            return hashlib.sha256(file.read()).hexdigest()[:16]
+    except OSError:
+        return "none"
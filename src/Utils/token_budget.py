@@ -0,0 +1,79 @@
+from typing import Dict, Any, List, Optional
+
+from src.Utils import json_codec
+
+# Rough provider-agnostic heuristic: ~4 characters per token for English text.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Estimates the token count of a string without calling a tokenizer."""
+    if not text:
+        return 0
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def truncate_text(text: str, max_tokens: int) -> str:
+    """Cuts a string down to roughly `max_tokens` tokens."""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    return text[: max(max_chars - 3, 0)].rstrip() + "..."
+
+
+def _shrink_value(value: Any, max_chars: int) -> Any:
+    """Truncates strings and drops trailing list items to fit `max_chars`."""
+    if isinstance(value, str):
+        return truncate_text(value, max_chars // CHARS_PER_TOKEN)
+
+    if isinstance(value, list):
+        kept, used = [], 0
+        for item in value:
+            item = _shrink_value(item, max_chars)
+            size = len(json_codec.dumps(item))
+            if kept and used + size > max_chars:
+                break
+            kept.append(item)
+            used += size
+        return kept
+
+    return value
+
+
+def build_prompt_context(
+    data: Dict[str, Any],
+    fields: Optional[List[str]] = None,
+    max_tokens: Optional[int] = None,
+) -> str:
+    """
+    Serializes product data for embedding in a prompt, within a token budget.
+
+    Args:
+        data: Product data dict
+        fields: Keys to include, in priority order (None keeps every key)
+        max_tokens: Budget for the serialized context (None disables trimming)
+
+    Returns:
+        Compact JSON string of the selected (and possibly trimmed) fields.
+    """
+    data = data or {}
+    if fields is None:
+        selected = dict(data)
+    else:
+        selected = {k: data[k] for k in fields if data.get(k) not in (None, "", [])}
+
+    text = json_codec.dumps(selected)
+    if max_tokens is None or estimate_tokens(text) <= max_tokens:
+        return text
+
+    # 1. Give every field an equal share of the budget
+    share = max(max_tokens * CHARS_PER_TOKEN // max(len(selected), 1), 16)
+    trimmed = {k: _shrink_value(v, share) for k, v in selected.items()}
+    text = json_codec.dumps(trimmed)
+
+    # 2. Still too big: drop the lowest-priority fields
+    while estimate_tokens(text) > max_tokens and len(trimmed) > 1:
+        trimmed.pop(next(reversed(trimmed)))
+        text = json_codec.dumps(trimmed)
+
+    return text
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Dict
 from src.core.workflow_state import WorkflowState
+from src.services import metrics
 
 class BaseAgent(ABC):
     """
@@ -31,4 +33,22 @@ class BaseAgent(ABC):
         Returns:
             WorkflowState: The updated state object after agent processing.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def _record_token_usage(self, state: WorkflowState, llm_gateway) -> None:
+        """
+        Adds the gateway's most recent call usage to the state's token accounting.
+        
+        Args:
+            state (WorkflowState): The workflow being processed.
+            llm_gateway: The gateway that just served a call.
+        """
+        usage = getattr(llm_gateway, "last_usage", None)
+        if usage:
+            state.record_token_usage(self.agent_name, usage)
+            self._count_tokens(usage)
+
+    def _count_tokens(self, usage: Dict[str, int]) -> None:
+        """Adds a call's token usage to the live metrics."""
+        for direction in ("input", "output"):
+            metrics.LLM_TOKENS.labels(agent=self.agent_name, direction=direction).inc(usage.get(f"{direction}_tokens", 0))
\ No newline at end of file
@@ -1,12 +1,14 @@
-import json
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 
+from config.settings import settings
 from src.core.workflow_state import WorkflowState
 from src.agents.base_agent import BaseAgent
 from src.schemas.product_data import ProductData
 from src.services.llm_gateway import LLMGateway
+from src.Utils import json_codec
 from src.Utils.prompt_loader import load_prompts
+from src.Utils.token_budget import truncate_text
 
 class DataIngestionAgent(BaseAgent):
     """
@@ -22,6 +24,7 @@ class DataIngestionAgent(BaseAgent):
             self.prompts = load_prompts()
         except Exception:
             self.prompts = {}
+        self.budget = settings.token_budget("ingestor")
 
     def process(self, state: WorkflowState) -> WorkflowState:
         # PATH A: Structured Data Exists
@@ -30,7 +33,8 @@ class DataIngestionAgent(BaseAgent):
 
         # PATH B: Raw Text -> Extract JSON
         if state.raw_input:
-            # We pass 'state' so we can log errors if extraction crashes
+            # We pass 'state' so we can log errors if extraction crashes.
+            # The raw JSON text is validated directly, without an intermediate dict.
             extracted_json = self._extract_json_from_text(state, state.raw_input)
             
             if extracted_json:
@@ -44,9 +48,9 @@ class DataIngestionAgent(BaseAgent):
         state.add_error("DataIngestion: No valid input provided.")
         return state
 
-    def _extract_json_from_text(self, state: WorkflowState, raw_text: str) -> Dict[str, Any]:
+    def _extract_json_from_text(self, state: WorkflowState, raw_text: str) -> str:
         """
-        Uses LLM to transform text into a Dict.
+        Uses LLM to transform text into a JSON string ("" if nothing was extracted).
         """
         # 1. Get Prompt from YAML
         system_prompt = self.prompts.get("data_ingestion", {}).get("extraction_prompt", "")
@@ -54,6 +58,11 @@ class DataIngestionAgent(BaseAgent):
              # Fallback if YAML is broken
              system_prompt = "You are a data extractor. Return JSON."
 
+        # Oversized listings are cut to the input budget before extraction
+        max_input = self.budget.get("max_input_tokens")
+        if max_input:
+            raw_text = truncate_text(raw_text, max_input)
+
         try:
             messages = [
                 {"role": "system", "content": system_prompt},
@@ -64,25 +73,30 @@ class DataIngestionAgent(BaseAgent):
             response_str = self.llm_gateway.chat_completion(
                 messages=messages,
                 temperature=0.0, 
-                response_format="json_object"
+                response_format="json_object",
+                max_output_tokens=self.budget.get("max_output_tokens")
             )
+            self._record_token_usage(state, self.llm_gateway)
             
-            # 3. Parse Response
+            # 3. Clean Response (parsing happens during validation)
             cleaned_str = self._sanitize_json(response_str)
-            return json.loads(cleaned_str)
+            return "" if cleaned_str in ("", "{}") else cleaned_str
             
         except Exception as e:
             # 4. Log Crash to State
             error_msg = f"DataIngestion: JSON Extraction Crashed. Error: {str(e)}"
             print(error_msg)
             state.add_error(error_msg)
-            return {}
+            return ""
 
-    def _validate_and_update(self, state: WorkflowState, data: Dict[str, Any]) -> WorkflowState:
-        """Validates the Dict and saves it to State."""
+    def _validate_and_update(self, state: WorkflowState, data: Union[Dict[str, Any], str, bytes]) -> WorkflowState:
+        """Validates the Dict (or raw JSON text) and saves it to State."""
         try:
             # Pydantic validates the structure
-            validated_model = ProductData(**data)
+            if isinstance(data, (str, bytes)):
+                validated_model = json_codec.decode_model(data, ProductData)
+            else:
+                validated_model = ProductData(**data)
             
             # Save as Dict
             state.product_data = validated_model.model_dump()
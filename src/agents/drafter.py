@@ -1,9 +1,14 @@
-import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from config.settings import settings
 from src.core.workflow_state import WorkflowState
 from src.agents.base_agent import BaseAgent
 from src.services.llm_gateway import LLMGateway
+from src.Utils import json_codec
 from src.Utils.prompt_loader import load_prompts
+from src.Utils.token_budget import build_prompt_context
+
+# Prefix of the retryable error left when a product's FAQs could not be answered
+FAQ_FAILURE = "ReviewFeedback: FAQ answers could not be generated"
 
 class DraftingAgent(BaseAgent):
     """
@@ -13,21 +18,47 @@ class DraftingAgent(BaseAgent):
         super().__init__(agent_name="Drafter")
         self.llm_gateway = llm_gateway or LLMGateway()
         self.prompts = load_prompts().get("content_factory", {})
+        self.budget = settings.token_budget("drafter")
 
     def process(self, state: WorkflowState) -> WorkflowState:
         print(f"[{self.agent_name}] Drafting content pages...")
 
         if not state.product_page:
             state.product_page = self._build_product_page(state.product_data)
-        
+
         if not state.faq_page:
-            state.faq_page = self._build_faq_page(state.product_data, state.generated_questions)
+            state.faq_page = self._build_faq_page(state, state.product_data, state.generated_questions)
+            if state.faq_page is None:
+                self._record_faq_failure(state)
 
         if not state.comparison_page:
             state.comparison_page = self._build_comparison_page(state.product_data, state.competitor_data)
-            
+
         return state
 
+    def draft_batch(self, states: List[WorkflowState]) -> List[WorkflowState]:
+        """
+        Drafts many workflows, answering their FAQs with one LLM call per chunk
+        of FAQ_BATCH_SIZE products instead of one call per product.
+        Products missing from (or malformed in) a batch response fall back to
+        an individual call inside `process`.
+
+        Library entry point for bulk drafting: the Orchestrator, the scheduler and
+        main.py's batch mode draft one workflow at a time and do not call it
+        (see docs/projectdocumentation.md).
+        """
+        pending = [s for s in states if not s.faq_page]
+        size = self._batch_size()
+
+        for start in range(0, len(pending), size):
+            chunk = pending[start:start + size]
+            answers = self._answer_faqs_batch(chunk)
+            for state, faqs in zip(chunk, answers):
+                if faqs:
+                    state.faq_page = self._faq_page(self._select_questions(state.generated_questions), faqs)
+
+        return [self.process(state) for state in states]
+
     def _build_product_page(self, data: Dict[str, Any]) -> Dict[str, Any]:
         # Simple Template Assembly
         return {
@@ -37,16 +68,131 @@ class DraftingAgent(BaseAgent):
             "content": "Generated via Agent System" # Simplified for brevity
         }
 
-    def _build_faq_page(self, data: Dict[str, Any], questions: List[str]) -> Dict[str, Any]:
-        # In a real run, you'd call LLM here to answer questions
+    def _build_faq_page(self, state: WorkflowState, data: Dict[str, Any], questions: List[str]) -> Optional[Dict[str, Any]]:
+        """Returns None when the questions could not all be answered, so the page is retried."""
+        selected = self._select_questions(questions)
+        if not selected:
+            return None
+        faqs = self._answer_faqs(state, data, selected)
+        if len(faqs) < len(selected):
+            return None
+        return self._faq_page(selected, faqs)
+
+    def _record_faq_failure(self, state: WorkflowState) -> None:
+        """Leaves a retryable error; after FAQ_MAX_ATTEMPTS failures the error becomes critical."""
+        attempts = sum(1 for e in state.errors if e.startswith(FAQ_FAILURE)) + 1
+        if attempts >= settings.FAQ_MAX_ATTEMPTS:
+            state.add_error(f"{self.agent_name}: FAQ answers could not be generated after {attempts} attempts.")
+        else:
+            state.add_error(f"{FAQ_FAILURE} (attempt {attempts}).")
+        print(f"[{self.agent_name}] ⚠️ FAQ answering failed (attempt {attempts})")
+
+    def _faq_page(self, questions: List[str], faqs: List[Dict[str, str]]) -> Dict[str, Any]:
         return {
             "page_type": "faq",
-            "questions": questions[:5]
+            "questions": questions,
+            "faqs": faqs
         }
 
+    def _select_questions(self, questions: List[str]) -> List[str]:
+        return questions[:settings.FAQ_QUESTION_COUNT]
+
+    def _batch_size(self) -> int:
+        """Products per batched call: FAQ_BATCH_SIZE, shrunk until the output budget fits the provider ceiling."""
+        max_output = self.budget.get("max_output_tokens")
+        size = max(settings.FAQ_BATCH_SIZE, 1)
+        if max_output:
+            size = min(size, max(settings.LLM_MAX_OUTPUT_TOKENS // max_output, 1))
+        return size
+
+    def _product_context(self, data: Dict[str, Any]) -> str:
+        return build_prompt_context(
+            data,
+            fields=settings.PROMPT_CONTEXT_FIELDS.get("drafter"),
+            max_tokens=self.budget.get("max_input_tokens"),
+        )
+
+    def _answer_faqs(self, state: WorkflowState, data: Dict[str, Any], questions: List[str]) -> List[Dict[str, str]]:
+        """Answers all questions for one product in a single structured call."""
+        raw_prompt = self.prompts.get("faq_answer_prompt", "Product: {product_data}\nQuestions: {questions}\nReturn JSON faqs.")
+        prompt = raw_prompt.format(
+            product_data=self._product_context(data),
+            questions=json_codec.dumps(questions)
+        )
+        response = self._call_llm_json(prompt, self.budget.get("max_output_tokens"))
+        self._record_token_usage(state, self.llm_gateway)
+        return self._clean_faqs(response.get("faqs"))
+
+    def _answer_faqs_batch(self, states: List[WorkflowState]) -> List[List[Dict[str, str]]]:
+        """Answers FAQs for several products in one call. Returns one (possibly empty) list per state."""
+        items = []
+        for idx, state in enumerate(states):
+            items.append({
+                "id": str(idx),
+                "product": json_codec.loads(self._product_context(state.product_data)),
+                "questions": self._select_questions(state.generated_questions)
+            })
+
+        raw_prompt = self.prompts.get("faq_batch_prompt", "Products: {items}\nReturn JSON results.")
+        prompt = raw_prompt.format(items=json_codec.dumps(items))
+        max_output = self.budget.get("max_output_tokens")
+        max_output = min(max_output * len(states), settings.LLM_MAX_OUTPUT_TOKENS) if max_output else None
+        response = self._call_llm_json(prompt, max_output)
+
+        # Share the batch call's tokens across its products; the call itself is counted once
+        usage = getattr(self.llm_gateway, "last_usage", None)
+        if usage:
+            self._count_tokens(usage)
+            for idx, state in enumerate(states):
+                share = {k: v // len(states) + (v % len(states) if idx == 0 else 0) for k, v in usage.items()}
+                state.record_token_usage(self.agent_name, share, calls=1 if idx == 0 else 0)
+
+        by_id = {}
+        results = response.get("results")
+        if isinstance(results, list):
+            for result in results:
+                if isinstance(result, dict):
+                    by_id[str(result.get("id"))] = self._clean_faqs(result.get("faqs"))
+
+        answers = []
+        for idx, state in enumerate(states):
+            faqs = by_id.get(str(idx), [])
+            # A partial answer set counts as malformed; the individual call retries it
+            if len(faqs) < len(items[idx]["questions"]):
+                faqs = []
+            answers.append(faqs)
+        return answers
+
+    def _clean_faqs(self, faqs: Any) -> List[Dict[str, str]]:
+        """Keeps only well-formed {question, answer} pairs."""
+        if not isinstance(faqs, list):
+            return []
+        cleaned = []
+        for item in faqs:
+            if not isinstance(item, dict):
+                continue
+            question, answer = item.get("question"), item.get("answer")
+            if isinstance(question, str) and isinstance(answer, str) and question.strip() and answer.strip():
+                cleaned.append({"question": question.strip(), "answer": answer.strip()})
+        return cleaned
+
+    def _call_llm_json(self, prompt: str, max_output_tokens: Optional[int] = None) -> Dict[str, Any]:
+        try:
+            messages = [{"role": "user", "content": prompt}]
+            resp = self.llm_gateway.chat_completion(
+                messages,
+                response_format="json_object",
+                max_output_tokens=max_output_tokens,
+            )
+            parsed = json_codec.loads(resp)
+            return parsed if isinstance(parsed, dict) else {}
+        except Exception as e:
+            print(f"Drafting Error: {e}")
+            return {}
+
     def _build_comparison_page(self, us: Dict[str, Any], them: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "page_type": "comparison",
             "us": us.get("product_name"),
             "them": them.get("product_name")
-        }
\ No newline at end of file
+        }
@@ -1,9 +1,11 @@
-import json
 from typing import Dict, Any, List
+from config.settings import settings
 from src.core.workflow_state import WorkflowState
 from src.agents.base_agent import BaseAgent
 from src.services.llm_gateway import LLMGateway
+from src.Utils import json_codec
 from src.Utils.prompt_loader import load_prompts
+from src.Utils.token_budget import build_prompt_context
 
 class ResearchAgent(BaseAgent):
     """
@@ -13,35 +15,47 @@ class ResearchAgent(BaseAgent):
         super().__init__(agent_name="Researcher")
         self.llm_gateway = llm_gateway or LLMGateway()
         self.prompts = load_prompts().get("content_factory", {}) # Reusing existing prompts
+        self.budget = settings.token_budget("researcher")
 
     def process(self, state: WorkflowState) -> WorkflowState:
         print(f"[{self.agent_name}] Conducting research...")
 
         # 1. Generate Competitor
         if not state.competitor_data:
-            state.competitor_data = self._generate_competitor()
+            state.competitor_data = self._generate_competitor(state)
 
         # 2. Generate Questions
         if not state.generated_questions:
-            state.generated_questions = self._generate_questions(state.product_data)
+            state.generated_questions = self._generate_questions(state, state.product_data)
             
         return state
 
-    def _generate_competitor(self) -> Dict[str, Any]:
+    def _generate_competitor(self, state: WorkflowState) -> Dict[str, Any]:
         prompt = self.prompts.get("competitor_prompt", "Generate competitor JSON")
-        return self._call_llm_json(prompt)
+        return self._call_llm_json(state, prompt)
 
-    def _generate_questions(self, product_data: Dict[str, Any]) -> List[str]:
+    def _generate_questions(self, state: WorkflowState, product_data: Dict[str, Any]) -> List[str]:
         raw_prompt = self.prompts.get("questions_prompt", "Generate questions JSON")
-        prompt = raw_prompt.replace("{data_str}", json.dumps(product_data))
-        response = self._call_llm_json(prompt)
+        # Only the fields that shape the questions, trimmed to the input budget
+        data_str = build_prompt_context(
+            product_data,
+            fields=settings.PROMPT_CONTEXT_FIELDS.get("researcher"),
+            max_tokens=self.budget.get("max_input_tokens"),
+        )
+        prompt = raw_prompt.replace("{data_str}", data_str)
+        response = self._call_llm_json(state, prompt)
         return response.get("questions", [])
 
-    def _call_llm_json(self, prompt: str) -> Dict[str, Any]:
+    def _call_llm_json(self, state: WorkflowState, prompt: str) -> Dict[str, Any]:
         try:
             messages = [{"role": "user", "content": prompt}]
-            resp = self.llm_gateway.chat_completion(messages, response_format="json_object")
-            return json.loads(resp)
+            resp = self.llm_gateway.chat_completion(
+                messages,
+                response_format="json_object",
+                max_output_tokens=self.budget.get("max_output_tokens"),
+            )
+            self._record_token_usage(state, self.llm_gateway)
+            return json_codec.loads(resp)
         except Exception as e:
             print(f"Research Error: {e}")
-            return {}
\ No newline at end of file
+            return {}
@@ -1,30 +1,23 @@
+from typing import List, Optional
 from src.core.workflow_state import WorkflowState
+from src.core.quality_rules import PageQualityChecker
 from src.agents.base_agent import BaseAgent
+from src.schemas.quality_report import PageReport
 
 class ReviewerAgent(BaseAgent):
     """
     Quality Assurance Agent.
-    Checks if the generated pages are populated and high quality.
+    Checks the generated pages against the declarative rules in config/quality_rules.yaml.
     """
-    def __init__(self):
+    def __init__(self, checker: Optional[PageQualityChecker] = None):
         super().__init__(agent_name="Reviewer")
+        self.checker = checker or PageQualityChecker()
 
     def process(self, state: WorkflowState) -> WorkflowState:
         print(f"[{self.agent_name}] conducting quality check...")
         
-        errors = []
-        
-        # Check Product Page
-        if not state.product_page or "content" not in state.product_page:
-            errors.append("Product page is missing content.")
-            
-        # Check FAQ
-        if not state.faq_page or len(state.faq_page.get("questions", [])) < 3:
-            errors.append("FAQ page has too few questions.")
-
-        # Check Comparison
-        if not state.comparison_page:
-            errors.append("Comparison page is missing.")
+        report = self.checker.check(state)
+        errors = [issue.message for issue in report.issues]
 
         if errors:
             print(f"[{self.agent_name}] ❌ Quality Check Failed: {errors}")
@@ -38,4 +31,11 @@ class ReviewerAgent(BaseAgent):
         else:
             print(f"[{self.agent_name}] ✅ Quality Check Passed!")
             
-        return state
\ No newline at end of file
+        return state
+
+    def review_batch(self, states: List[WorkflowState]) -> List[PageReport]:
+        """
+        Validates many finished workflows in one pass without touching their state.
+        Returns one structured PageReport per workflow, in input order.
+        """
+        return self.checker.check_batch(states)
@@ -1,20 +1,74 @@
-from typing import Dict
+import time
+from typing import Dict, List, Optional
 from src.core.workflow_state import WorkflowState
 from src.agents.base_agent import BaseAgent
 from src.agents.supervisor import SupervisorAgent
+from src.services import metrics
+from src.services.artifact_store import ArtifactStore
+from src.services.single_flight import SingleFlight, all_stats
 from src.Utils.logger import RunLogger
 
 class Orchestrator:
-    def __init__(self, supervisor: SupervisorAgent, agents: Dict[str, BaseAgent]):
+    def __init__(
+        self,
+        supervisor: SupervisorAgent,
+        agents: Dict[str, BaseAgent],
+        artifact_store: Optional[ArtifactStore] = None,
+        single_flight: Optional[SingleFlight] = None,
+        report_path: str = "run_report.md"
+    ):
         self.supervisor = supervisor
         self.agents = agents
+        self.artifact_store = artifact_store
+        # Shared across Orchestrators so concurrent identical inputs run once
+        self.single_flight = single_flight
         self.logger = RunLogger()
+        # Concurrent workflows (see RequestScheduler) each need their own report file
+        self.report_path = report_path
+        self._dedupe_baseline: Dict[str, Dict[str, int]] = {}
 
     def run(self, initial_state: WorkflowState) -> WorkflowState:
+        metrics.WORKFLOWS_IN_FLIGHT.inc()
+        status = "failed"
+        # Dedupe counters are process-wide; reports show what changed during this run
+        self._dedupe_baseline = self._dedupe_stats()
+        try:
+            if self.single_flight:
+                state, shared = self.single_flight.do(
+                    initial_state.normalized_input(), lambda: self._run(initial_state)
+                )
+                if shared:
+                    # Every waiter gets its own copy of the leader's result; the tokens were spent by the leader
+                    state = state.model_copy(deep=True)
+                    state.token_usage = {}
+                    self.logger.log_step("Orchestrator", "Deduplicated", "Shared result of an identical in-flight workflow")
+                    self._save_report(state)
+            else:
+                state = self._run(initial_state)
+            if state.is_complete and not self._critical_errors(state):
+                status = "cached" if state.last_agent == "cache" else "success"
+            return state
+        finally:
+            metrics.WORKFLOWS_IN_FLIGHT.dec()
+            metrics.WORKFLOWS_COMPLETED.labels(status=status).inc()
+
+    def _run(self, initial_state: WorkflowState) -> WorkflowState:
         state = initial_state
         print("Orchestrator Started (Dynamic Mode)")
         self.logger.log_step("Orchestrator", "Startup", "Initializing Dynamic Workflow")
 
+        # 0. Incremental regeneration: unchanged input/prompts/model reuse stored pages
+        store_key = None
+        if self.artifact_store:
+            store_key = self.artifact_store.key_for(state)
+            entry = self.artifact_store.get(state, key=store_key)
+            if entry:
+                self.logger.log_step("Orchestrator", "Cache Hit", f"Reused stored pages `{store_key[:12]}`")
+                self._save_report(state)
+                state = self.artifact_store.apply(state, entry)
+                state.last_agent = "cache"
+                return state
+
         steps = 0
         MAX_STEPS = 15
 
@@ -33,21 +87,30 @@ class Orchestrator:
             # 3. Execute Agent
             agent = self.agents.get(next_agent)
             if agent:
+                start = time.monotonic()
+                errors_before = len(state.errors)
                 try:
                     state = agent.process(state)
+                    # The Supervisor routes freshly drafted pages to the reviewer based on this
+                    state.last_agent = next_agent
                     self.logger.log_step(next_agent, "Success", "Task completed")
                     
-                    # Special log if feedback was given
-                    if state.errors and "ReviewFeedback" in state.errors[-1]:
+                    # Special log if this step gave feedback (errors are never cleared, so only count new ones)
+                    if len(state.errors) > errors_before and "ReviewFeedback" in state.errors[-1]:
                          self.logger.log_step(next_agent, "⚠️ Issue Detected", "Triggered Self-Correction")
+                         if next_agent == "reviewer":
+                             metrics.REVIEW_ITERATIONS.inc()
                          
                 except Exception as e:
                     self.logger.log_step(next_agent, "CRITICAL ERROR", str(e))
                     state.add_error(str(e))
+                    metrics.AGENT_ERRORS.labels(agent=next_agent).inc()
+                finally:
+                    metrics.AGENT_STEP_SECONDS.labels(agent=next_agent).observe(time.monotonic() - start)
             
             steps += 1
             
-        self.logger.save_report()
+        self._save_report(state)
         # Guard against infinite loops
         for _ in range(15):
             if state.is_complete:
@@ -67,10 +130,37 @@ class Orchestrator:
             worker = self.agents.get(next_agent_name)
             
             if worker:
+                start = time.monotonic()
                 state = worker.process(state)
+                metrics.AGENT_STEP_SECONDS.labels(agent=next_agent_name).observe(time.monotonic() - start)
                 state.last_agent = next_agent_name
             else:
                 state.add_error(f"Unknown agent: {next_agent_name}")
                 break
+
+        if self.artifact_store and self._is_storable(state):
+            self.artifact_store.put(state, key=store_key)
                 
-        return state
\ No newline at end of file
+        return state
+
+    def _save_report(self, state: WorkflowState) -> None:
+        self.logger.record_token_usage(state.token_usage)
+        dedupe = {}
+        for layer, stats in self._dedupe_stats().items():
+            start = self._dedupe_baseline.get(layer, {})
+            dedupe[layer] = {k: v - start.get(k, 0) for k, v in stats.items()}
+        self.logger.record_dedupe(dedupe)
+        self.logger.save_report(self.report_path)
+
+    def _dedupe_stats(self) -> Dict[str, Dict[str, int]]:
+        dedupe = all_stats()
+        if self.single_flight:
+            dedupe[self.single_flight.name] = self.single_flight.stats()
+        return dedupe
+
+    def _is_storable(self, state: WorkflowState) -> bool:
+        """Only clean, complete runs are cached (review feedback that was resolved is fine)."""
+        return state.is_complete and not self._critical_errors(state)
+
+    def _critical_errors(self, state: WorkflowState) -> List[str]:
+        return [e for e in state.errors if "ReviewFeedback" not in e]
\ No newline at end of file
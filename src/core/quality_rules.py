@@ -0,0 +1,166 @@
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from src.core.workflow_state import WorkflowState
+from src.schemas.quality_report import PageReport, QualityRule, RuleIssue
+from src.Utils.file_manager import ArtifactSaver
+from src.Utils.prompt_loader import load_prompts
+
+PAGE_KEYS = ("product_page", "faq_page", "comparison_page")
+
+# A compiled rule: (page, product_data) -> failure message or None
+Check = Callable[[Dict[str, Any], Dict[str, Any]], Optional[str]]
+Bundle = Union[WorkflowState, Dict[str, Any]]
+
+# Resolved from the package, not the working directory, so the reviewer never runs rule-less
+RULES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "config", "quality_rules.yaml")
+
+
+def load_rules(config_path: str = RULES_PATH) -> List[QualityRule]:
+    """
+    Loads the declarative rule set, one QualityRule per YAML entry.
+    Raises if the file is missing or defines no rules: an empty rule set would pass every page.
+    """
+    if not os.path.exists(config_path):
+        raise FileNotFoundError(f"Quality rules not found at {config_path}")
+    config = load_prompts(config_path)
+    rules = []
+    for page, entries in config.items():
+        for entry in entries or []:
+            rules.append(QualityRule(page=page, **entry))
+    if not rules:
+        raise ValueError(f"No quality rules defined in {config_path}")
+    return rules
+
+
+def _values(page: Dict[str, Any], rule: QualityRule) -> List[Any]:
+    """Returns the inspected value(s): each list item (or its `item_key`), else the field itself."""
+    value = page.get(rule.field)
+    if not isinstance(value, list):
+        return [] if rule.item_key else [value]
+    if rule.item_key is None:
+        return value
+    return [item.get(rule.item_key) if isinstance(item, dict) else None for item in value]
+
+
+def _normalize(value: Any) -> str:
+    return " ".join(str(value).split()).lower()
+
+
+def _compile_rule(rule: QualityRule) -> Check:
+    label = rule.page.replace("_", " ").capitalize()
+
+    if rule.kind == "present":
+        def check(page, product):
+            if not page:
+                return rule.message or f"{label} is missing."
+
+    elif rule.kind == "required_keys":
+        def check(page, product):
+            missing = [key for key in rule.keys if page.get(key) in (None, "", [], {})]
+            if missing:
+                return rule.message or f"{label} is missing {', '.join(missing)}."
+
+    elif rule.kind == "min_count":
+        def check(page, product):
+            value = page.get(rule.field)
+            count = len(value) if isinstance(value, list) else 0
+            if count < (rule.min or 0):
+                return rule.message or f"{label} has {count} {rule.field}, expected at least {rule.min}."
+
+    elif rule.kind == "answered":
+        def check(page, product):
+            asked = page.get(rule.field)
+            asked = len(asked) if isinstance(asked, list) else 0
+            answers = page.get(rule.answers)
+            answers = answers if isinstance(answers, list) else []
+            answered = sum(1 for item in answers if isinstance(item, dict) and str(item.get(rule.item_key) or "").strip())
+            if answered < asked:
+                return rule.message or f"{label} answers {answered} of {asked} {rule.field}."
+
+    elif rule.kind == "length":
+        target = f"{rule.field}.{rule.item_key}" if rule.item_key else rule.field
+
+        def check(page, product):
+            for value in _values(page, rule):
+                if value is None:
+                    continue
+                size = len(str(value).strip())
+                if (rule.min is not None and size < rule.min) or (rule.max is not None and size > rule.max):
+                    return rule.message or f"{label} {target} length {size} outside [{rule.min}, {rule.max}]."
+
+    elif rule.kind == "unique":
+        def check(page, product):
+            seen = set()
+            for value in _values(page, rule):
+                if value is None:
+                    continue
+                key = _normalize(value)
+                if key in seen:
+                    return rule.message or f"{label} has duplicate {rule.field}: '{value}'."
+                seen.add(key)
+
+    elif rule.kind == "matches_product":
+        def check(page, product):
+            ours, expected = page.get(rule.field), product.get(rule.product_field)
+            if ours in (None, "") or expected in (None, ""):
+                return None
+            if _normalize(ours) != _normalize(expected):
+                return rule.message or f"{label} {rule.field} '{ours}' does not match product {rule.product_field} '{expected}'."
+
+    else:
+        raise ValueError(f"Unknown quality rule kind: {rule.kind}")
+
+    return check
+
+
+class PageQualityChecker:
+    """
+    Compiles a declarative rule set once and validates batches of finished pages.
+
+    Rules are grouped per page so each bundle is visited once; the result is one
+    PageReport per bundle, in input order.
+    """
+
+    def __init__(self, rules: Optional[List[QualityRule]] = None):
+        self.rules = rules if rules is not None else load_rules()
+        self._compiled: Dict[str, List[Tuple[str, Check]]] = {}
+        for rule in self.rules:
+            self._compiled.setdefault(rule.page, []).append((rule.kind, _compile_rule(rule)))
+
+    def check(self, bundle: Bundle, page_id: str = "0") -> PageReport:
+        pages, product = self._unpack(bundle)
+        issues = []
+        for page_key, checks in self._compiled.items():
+            page = pages.get(page_key)
+            if not isinstance(page, dict):
+                page = {}
+            for kind, check in checks:
+                message = check(page, product)
+                if message:
+                    issues.append(RuleIssue(page=page_key, rule=kind, message=message))
+        return PageReport(page_id=page_id, passed=not issues, issues=issues)
+
+    def check_batch(self, bundles: Iterable[Bundle], page_ids: Optional[List[str]] = None) -> List[PageReport]:
+        """Validates many page bundles in one pass."""
+        reports = []
+        for idx, bundle in enumerate(bundles):
+            page_id = page_ids[idx] if page_ids else str(idx)
+            reports.append(self.check(bundle, page_id))
+        return reports
+
+    def _unpack(self, bundle: Bundle) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        if isinstance(bundle, WorkflowState):
+            pages = {key: getattr(bundle, key) for key in PAGE_KEYS}
+            return pages, bundle.product_data or {}
+        return bundle, bundle.get("product_data") or {}
+
+
+def validate_saved_artifacts(output_dirs: List[str], checker: Optional[PageQualityChecker] = None) -> List[PageReport]:
+    """
+    Re-validates artifacts written by ArtifactSaver, offline (no LLM calls).
+    Each directory is one product; its name is used as the report's page_id.
+    """
+    checker = checker or PageQualityChecker()
+    bundles = [ArtifactSaver.load_artifacts(path) for path in output_dirs]
+    return checker.check_batch(bundles, page_ids=[os.path.basename(os.path.normpath(p)) for p in output_dirs])
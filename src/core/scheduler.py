@@ -0,0 +1,204 @@
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Deque, Dict, List, Optional, Union
+
+from config.settings import settings
+from src.core.orchestrator import Orchestrator
+from src.core.workflow_state import WorkflowState
+from src.schemas.requests import UserRequest
+from src.services import metrics
+from src.services.concurrency import AdaptiveLimiter
+
+# Served strictly in this order; bulk only runs on spare capacity
+PRIORITY_CLASSES = ("interactive", "bulk")
+
+# How often idle workers re-check LLM headroom while bulk work is held back
+ADMISSION_POLL_SECONDS = 0.05
+
+
+class _Job:
+    __slots__ = ("job_id", "state", "priority", "tenant", "finish_tag", "future", "submitted_at")
+
+    def __init__(self, job_id: int, state: WorkflowState, priority: str, tenant: str, finish_tag: float):
+        self.job_id = job_id
+        self.state = state
+        self.priority = priority
+        self.tenant = tenant
+        self.finish_tag = finish_tag
+        self.future: Future = Future()
+        self.submitted_at = time.monotonic()
+
+
+class RequestScheduler:
+    """
+    Priority-aware front door for the Orchestrator.
+
+    Responsibilities:
+    - Strict priority between classes: interactive before bulk
+    - Weighted fair queuing between tenants within a class
+    - Admission control: bulk workflows start only while the LLM limiter has
+      headroom, and never on the workers reserved for interactive requests
+    """
+
+    def __init__(
+        self,
+        orchestrator_factory: Callable[[], Orchestrator],
+        workers: Optional[int] = None,
+        reserved_interactive: Optional[int] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+        tenant_weights: Optional[Dict[str, float]] = None,
+        report_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            orchestrator_factory: Builds one Orchestrator per job (agents may be shared)
+            workers: Concurrent workflows (defaults to settings.SCHEDULER_WORKERS)
+            reserved_interactive: Workers bulk jobs may not use (clamped to workers - 1)
+            limiter: LLM limiter consulted for bulk admission (None disables the check)
+            tenant_weights: Relative share per tenant (default 1.0)
+            report_dir: Where each job's run report goes (defaults to settings.SCHEDULER_REPORT_DIR)
+        """
+        self.orchestrator_factory = orchestrator_factory
+        self.workers = workers or settings.SCHEDULER_WORKERS
+        reserved = settings.SCHEDULER_RESERVED_INTERACTIVE_WORKERS if reserved_interactive is None else reserved_interactive
+        # Leave bulk at least one worker, otherwise bulk jobs could never run and shutdown would hang
+        self.reserved_interactive = min(max(reserved, 0), self.workers - 1)
+        self.max_bulk_running = self.workers - self.reserved_interactive
+        self.limiter = limiter
+        self.tenant_weights = tenant_weights or {}
+        self.report_dir = report_dir or settings.SCHEDULER_REPORT_DIR
+        self._job_ids = itertools.count(1)
+
+        self._queues: Dict[str, Dict[str, Deque[_Job]]] = {p: {} for p in PRIORITY_CLASSES}
+        self._last_finish: Dict[str, Dict[str, float]] = {p: {} for p in PRIORITY_CLASSES}
+        self._virtual_time: Dict[str, float] = {p: 0.0 for p in PRIORITY_CLASSES}
+        self._running_bulk = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+
+    # ------------------ Lifecycle ------------------ #
+
+    def start(self) -> "RequestScheduler":
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"scheduler-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops accepting work; workers exit once the queues drain."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    # ------------------ Submission ------------------ #
+
+    def submit(
+        self,
+        request: Union[UserRequest, WorkflowState],
+        priority: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> Future:
+        """
+        Queues a workflow. Returns a Future resolving to the final WorkflowState.
+        UserRequests carry their own priority/tenant; WorkflowStates default to bulk.
+        """
+        if isinstance(request, UserRequest):
+            state = WorkflowState(raw_input=request.user_input)
+            priority = priority or request.priority
+            tenant = tenant or request.tenant
+        else:
+            state = request
+        priority = priority or "bulk"
+        tenant = tenant or "default"
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority class: {priority}")
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Scheduler is shut down")
+            # Start-time fair queuing: each job advances its tenant by 1/weight
+            weight = max(self.tenant_weights.get(tenant, 1.0), 1e-6)
+            start_tag = max(self._virtual_time[priority], self._last_finish[priority].get(tenant, 0.0))
+            job = _Job(next(self._job_ids), state, priority, tenant, start_tag + 1.0 / weight)
+            self._last_finish[priority][tenant] = job.finish_tag
+            self._queues[priority].setdefault(tenant, deque()).append(job)
+            metrics.SCHEDULER_QUEUE_DEPTH.labels(priority=priority).inc()
+            self._cond.notify()
+        return job.future
+
+    def queue_depth(self) -> Dict[str, int]:
+        with self._cond:
+            return {p: sum(len(q) for q in self._queues[p].values()) for p in PRIORITY_CLASSES}
+
+    # ------------------ Dispatch ------------------ #
+
+    def _bulk_admitted(self) -> bool:
+        if self._running_bulk >= self.max_bulk_running:
+            return False
+        if self.limiter is None:
+            return True
+        # Only start new bulk work while LLM calls are not already queueing
+        return self.limiter.in_flight + self.limiter.waiting < self.limiter.limit
+
+    def _next_job(self) -> Optional[_Job]:
+        """Picks the next job (caller holds the lock)."""
+        for priority in PRIORITY_CLASSES:
+            if priority == "bulk" and not self._bulk_admitted():
+                continue
+            queues = self._queues[priority]
+            heads = [(q[0].finish_tag, tenant) for tenant, q in queues.items() if q]
+            if not heads:
+                continue
+            _, tenant = min(heads)
+            job = queues[tenant].popleft()
+            if not queues[tenant]:
+                del queues[tenant]
+            self._virtual_time[priority] = job.finish_tag
+            return job
+        return None
+
+    def _orchestrator_for(self, job: _Job) -> Orchestrator:
+        orchestrator = self.orchestrator_factory()
+        # Workflows run concurrently; a shared report file would be overwritten mid-write
+        if hasattr(orchestrator, "report_path"):
+            orchestrator.report_path = os.path.join(self.report_dir, f"run_report_{job.job_id:05d}.md")
+        return orchestrator
+
+    def _has_pending(self) -> bool:
+        return any(self._queues[p] for p in PRIORITY_CLASSES)
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                job = self._next_job()
+                while job is None:
+                    if self._closed and not self._has_pending():
+                        return
+                    # Timed wait: LLM headroom changes without notifying us
+                    self._cond.wait(timeout=ADMISSION_POLL_SECONDS)
+                    job = self._next_job()
+                if job.priority == "bulk":
+                    self._running_bulk += 1
+
+            metrics.SCHEDULER_QUEUE_DEPTH.labels(priority=job.priority).dec()
+            metrics.SCHEDULER_WAIT_SECONDS.labels(priority=job.priority).observe(time.monotonic() - job.submitted_at)
+            try:
+                if job.future.set_running_or_notify_cancel():
+                    try:
+                        job.future.set_result(self._orchestrator_for(job).run(job.state))
+                    except Exception as e:
+                        job.future.set_exception(e)
+            finally:
+                with self._cond:
+                    if job.priority == "bulk":
+                        self._running_bulk -= 1
+                    self._cond.notify_all()
@@ -1,6 +1,9 @@
+import unicodedata
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
 
+from src.Utils import json_codec
+
 class WorkflowState(BaseModel):
     # --- INPUTS ---
     raw_input: Optional[str] = None
@@ -22,6 +25,31 @@ class WorkflowState(BaseModel):
     
     # --- METADATA ---
     errors: List[str] = Field(default_factory=list)
+    # Per-agent LLM usage: {"Researcher": {"calls": 2, "input_tokens": .., "output_tokens": ..}}
+    token_usage: Dict[str, Dict[str, int]] = Field(default_factory=dict)
 
     def add_error(self, message: str) -> None:
-        self.errors.append(message)
\ No newline at end of file
+        self.errors.append(message)
+
+    def record_token_usage(self, agent: str, usage: Dict[str, int], calls: int = 1) -> None:
+        totals = self.token_usage.setdefault(
+            agent, {"calls": 0, "input_tokens": 0, "output_tokens": 0}
+        )
+        totals["calls"] += calls
+        totals["input_tokens"] += usage.get("input_tokens", 0)
+        totals["output_tokens"] += usage.get("output_tokens", 0)
+
+    def normalized_input(self) -> str:
+        """Canonical form of the input: whitespace-collapsed raw text, else key-sorted JSON."""
+        if self.raw_input:
+            text = unicodedata.normalize("NFKC", self.raw_input)
+            return "raw:" + " ".join(text.split())
+        return "data:" + json_codec.dumps(_sorted(self.product_data))
+
+
+def _sorted(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _sorted(value[k]) for k in sorted(value)}
+    if isinstance(value, list):
+        return [_sorted(v) for v in value]
+    return value
@@ -0,0 +1,35 @@
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class QualityRule(BaseModel):
+    """
+    One declarative page-quality rule (see config/quality_rules.yaml).
+    """
+
+    page: str = Field(..., description="Page the rule applies to, e.g. 'faq_page'")
+    kind: Literal["present", "required_keys", "min_count", "length", "unique", "matches_product", "answered"]
+    field: Optional[str] = Field(default=None, description="Page key the rule inspects")
+    item_key: Optional[str] = Field(default=None, description="Key inside each list item (for lists of dicts)")
+    keys: List[str] = Field(default_factory=list, description="Keys required by 'required_keys'")
+    answers: Optional[str] = Field(default=None, description="List of answer dicts checked by 'answered'")
+    min: Optional[int] = None
+    max: Optional[int] = None
+    product_field: Optional[str] = Field(default=None, description="product_data key for 'matches_product'")
+    message: Optional[str] = Field(default=None, description="Override for the failure message")
+
+
+class RuleIssue(BaseModel):
+    page: str
+    rule: str
+    message: str
+
+
+class PageReport(BaseModel):
+    """
+    Quality result for one product's set of pages.
+    """
+
+    page_id: str
+    passed: bool
+    issues: List[RuleIssue] = Field(default_factory=list)
@@ -1,3 +1,4 @@
+from typing import Literal
 from pydantic import BaseModel, Field
 
 
@@ -11,3 +12,11 @@ class UserRequest(BaseModel):
         ...,
         description="Raw natural language request from the user"
     )
+    priority: Literal["interactive", "bulk"] = Field(
+        default="interactive",
+        description="Scheduling class: ad-hoc requests are interactive, catalog runs bulk"
+    )
+    tenant: str = Field(
+        default="default",
+        description="Team or merchant the request is accounted to for fair sharing"
+    )
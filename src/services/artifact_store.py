@@ -0,0 +1,128 @@
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from config.settings import settings
+from src.core.quality_rules import RULES_PATH
+from src.core.workflow_state import WorkflowState
+from src.services import metrics
+from src.Utils import json_codec
+from src.Utils.prompt_loader import prompt_version
+
+PAGE_KEYS = ("product_page", "faq_page", "comparison_page")
+
+
+def generation_config_version() -> str:
+    """
+    Hash of the settings and rule file that shape generated pages besides prompts.yaml.
+    Changing any of them must regenerate stored products.
+    """
+    material = {
+        "faq_question_count": settings.FAQ_QUESTION_COUNT,
+        "token_budgets": settings.TOKEN_BUDGETS,
+        "prompt_context_fields": settings.PROMPT_CONTEXT_FIELDS,
+        "llm_max_output_tokens": settings.LLM_MAX_OUTPUT_TOKENS,
+        "quality_rules": prompt_version(RULES_PATH),
+    }
+    return hashlib.sha256(json_codec.dumps_bytes(material)).hexdigest()[:16]
+
+
+class ArtifactStore:
+    """
+    Content-addressed store of finished pages.
+
+    Entries are keyed by sha256(normalized input + prompt version + generation
+    config version + model name), so a product is only regenerated when its input,
+    prompts.yaml, the generation settings / quality rules or the model change.
+    Layout: <root>/<key[:2]>/<key>.json
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        root: Optional[str] = None,
+        prompts_version: Optional[str] = None,
+        config_version: Optional[str] = None,
+    ):
+        """
+        Args:
+            model_name: Model the pages were (or will be) generated with
+            root: Store directory (defaults to settings.ARTIFACT_STORE_DIR)
+            prompts_version: Override for the prompt file hash
+            config_version: Override for the generation settings / rules hash
+        """
+        self.model_name = model_name
+        self.root = root or settings.ARTIFACT_STORE_DIR
+        self.prompts_version = prompts_version or prompt_version()
+        self.config_version = config_version or generation_config_version()
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, state: WorkflowState) -> str:
+        material = "\n".join([state.normalized_input(), self.prompts_version, self.config_version, self.model_name])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f"{key}.json")
+
+    def get(self, state: WorkflowState, key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Returns the stored entry for this workflow's input, or None."""
+        path = self._path(key or self.key_for(state))
+        try:
+            with open(path, "rb") as f:
+                entry = json_codec.loads(f.read())
+        except (OSError, ValueError):
+            self.misses += 1
+            metrics.CACHE_LOOKUPS.labels(result="miss").inc()
+            return None
+
+        if not all(entry.get(page) for page in PAGE_KEYS):
+            self.misses += 1
+            metrics.CACHE_LOOKUPS.labels(result="miss").inc()
+            return None
+        self.hits += 1
+        metrics.CACHE_LOOKUPS.labels(result="hit").inc()
+        return entry
+
+    def put(self, state: WorkflowState, key: Optional[str] = None) -> Optional[str]:
+        """
+        Stores a finished workflow's pages. Returns the key, or None if nothing was stored.
+        Pass the key computed before the run, since ingestion rewrites product_data.
+        """
+        if not all(getattr(state, page) for page in PAGE_KEYS):
+            return None
+
+        key = key or self.key_for(state)
+        entry = {
+            "key": key,
+            "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "model_name": self.model_name,
+            "prompts_version": self.prompts_version,
+            "config_version": self.config_version,
+            "product_data": state.product_data,
+        }
+        entry.update({page: getattr(state, page) for page in PAGE_KEYS})
+
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write-then-rename so concurrent readers never see a partial file
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(json_codec.dumps_bytes(entry))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ Artifact store write failed: {e}")
+            return None
+        return key
+
+    def apply(self, state: WorkflowState, entry: Dict[str, Any]) -> WorkflowState:
+        """Fills a workflow from a stored entry and marks it complete."""
+        state.product_data = entry.get("product_data") or state.product_data
+        for page in PAGE_KEYS:
+            setattr(state, page, entry[page])
+        state.is_complete = True
+        state.next_agent = "FINISH"
+        return state
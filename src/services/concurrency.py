@@ -0,0 +1,173 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from config.settings import settings
+from src.services import metrics
+
+
+class Permit:
+    """
+    Handle for one in-flight call. Set `throttled = True` when the provider
+    rejected the call with a rate-limit response.
+    """
+
+    def __init__(self):
+        self.throttled: bool = False
+        self.failed: bool = False
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter for outbound LLM calls.
+
+    Responsibilities:
+    - Block callers while `in_flight` has reached the current limit
+    - Additive increase (+1 per limit's worth of healthy calls)
+    - Multiplicative decrease on throttling (x backoff) and on the smoothed
+      latency of a call class rising above that class's baseline (x 0.9)
+
+    Latency is tracked per call class (e.g. output-token budget), so long
+    batched calls are never compared against short extraction calls.
+
+    Thread-safe; one instance is shared by every LLMGateway in the process.
+    """
+
+    LATENCY_DECREASE = 0.9
+    # How fast the latency baseline drifts upwards (it drops immediately)
+    BASELINE_DRIFT = 0.01
+    # Weight of the newest call in a class's smoothed latency
+    SMOOTHING = 0.2
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        self.min_limit = max(min_limit, 1)
+        self.max_limit = max(max_limit, self.min_limit)
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+
+        self._limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._waiting = 0
+        # call class -> [baseline latency, smoothed latency]
+        self._latency: Dict[str, List[float]] = {}
+        self._throttled_total = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Waits for a free slot. Returns False if `timeout` expired first."""
+        with self._cond:
+            self._waiting += 1
+            try:
+                if not self._cond.wait_for(lambda: self._in_flight < int(self._limit), timeout):
+                    return False
+            finally:
+                self._waiting -= 1
+            self._in_flight += 1
+            return True
+
+    def release(self, latency: Optional[float] = None, throttled: bool = False, call_class: str = "default") -> None:
+        """
+        Frees a slot and adapts the limit.
+
+        Args:
+            latency: Seconds the call took (None for failures that say nothing about load)
+            throttled: The provider answered with a rate-limit error
+            call_class: Calls of similar size; latency is only compared within a class
+        """
+        with self._cond:
+            self._in_flight = max(self._in_flight - 1, 0)
+
+            if throttled:
+                self._throttled_total += 1
+                self._limit = max(self.min_limit, self._limit * self.backoff)
+            elif latency is not None:
+                stats = self._latency.get(call_class)
+                if stats is None:
+                    stats = self._latency[call_class] = [latency, latency]
+                baseline, smoothed = stats
+                smoothed += self.SMOOTHING * (latency - smoothed)
+                if latency < baseline:
+                    baseline = latency
+                else:
+                    baseline += self.BASELINE_DRIFT * (latency - baseline)
+                stats[:] = [baseline, smoothed]
+
+                # A sustained rise within the class (not one slow call) signals provider queueing
+                if smoothed > baseline * self.latency_tolerance:
+                    self._limit = max(self.min_limit, self._limit * self.LATENCY_DECREASE)
+                else:
+                    self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, call_class: str = "default") -> Iterator[Permit]:
+        """Holds a slot for the duration of one call and reports its outcome."""
+        self.acquire()
+        permit = Permit()
+        start = time.monotonic()
+        try:
+            yield permit
+        except BaseException:
+            permit.failed = True
+            raise
+        finally:
+            if permit.throttled:
+                self.release(throttled=True)
+            elif permit.failed:
+                self.release()
+            else:
+                self.release(latency=time.monotonic() - start, call_class=call_class)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current metrics: limit, in_flight, waiting, throttled_total, baseline_latency (fastest class)."""
+        with self._cond:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "waiting": self._waiting,
+                "throttled_total": self._throttled_total,
+                "baseline_latency": min((b for b, _ in self._latency.values()), default=0.0),
+            }
+
+
+_shared_limiter: Optional[AdaptiveLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_limiter() -> AdaptiveLimiter:
+    """Returns the process-wide limiter, creating it from settings on first use."""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = AdaptiveLimiter(
+                initial=settings.LLM_CONCURRENCY_INITIAL,
+                min_limit=settings.LLM_CONCURRENCY_MIN,
+                max_limit=settings.LLM_CONCURRENCY_MAX,
+                latency_tolerance=settings.LLM_LATENCY_TOLERANCE,
+            )
+            limiter = _shared_limiter
+            metrics.LLM_CONCURRENCY_LIMIT.set_function(lambda: limiter.limit)
+            metrics.LLM_IN_FLIGHT.set_function(lambda: limiter.in_flight)
+            metrics.LLM_QUEUE_DEPTH.set_function(lambda: limiter.waiting)
+        return _shared_limiter
@@ -1,8 +1,19 @@
+import hashlib
 import os
+import threading
+import time
 import google.generativeai as genai
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 from dotenv import load_dotenv
 
+from config.settings import settings
+from src.services import metrics
+from src.services.concurrency import AdaptiveLimiter, get_shared_limiter
+from src.services.prompt_cache import PromptCache, get_prompt_cache
+from src.services.single_flight import SingleFlight, get_single_flight
+from src.Utils import json_codec
+from src.Utils.token_budget import estimate_tokens
+
 load_dotenv()
 
 class LLMGateway:
@@ -11,17 +22,40 @@ class LLMGateway:
     Automatically finds a valid model to avoid 404 errors.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        limiter: Optional[AdaptiveLimiter] = None,
+        single_flight: Optional[SingleFlight] = None,
+        prompt_cache: Optional[PromptCache] = None,
+    ):
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise ValueError("Missing Gemini API Key in .env")
 
         genai.configure(api_key=api_key)
+
+        # Token usage of the calling thread's most recent call (see `last_usage`)
+        self._local = threading.local()
+
+        # In-flight calls are capped by the process-wide adaptive limiter
+        self.limiter = limiter or get_shared_limiter()
+        self.single_flight = single_flight or get_single_flight("llm")
+        # Provider-side caching of long system prompts (None = always send inline)
+        self.prompt_cache = prompt_cache or get_prompt_cache()
         
         # AUTO-DISCOVERY LOGIC
         self.model_name = self._find_working_model()
         print(f"✅ Gemini Gateway initialized using: {self.model_name}")
 
+    @property
+    def last_usage(self) -> Dict[str, int]:
+        """Token usage of this thread's most recent call: {"input_tokens", "output_tokens"}."""
+        return getattr(self._local, "usage", {})
+
+    @last_usage.setter
+    def last_usage(self, usage: Dict[str, int]) -> None:
+        self._local.usage = usage
+
     def _find_working_model(self) -> str:
         """Query the API to find the first available text generation model."""
         try:
@@ -43,8 +77,29 @@ class LLMGateway:
         messages: List[Dict[str, str]],
         temperature: float = 0.0,
         response_format: str = "text",
+        max_output_tokens: Optional[int] = None,
     ) -> Optional[str]:
         
+        # Identical requests already in flight (from any gateway) share one provider call
+        key = hashlib.sha256(json_codec.dumps_bytes(
+            [self.model_name, messages, temperature, response_format, max_output_tokens]
+        )).hexdigest()
+        text, shared = self.single_flight.do(
+            key, lambda: self._complete(messages, temperature, response_format, max_output_tokens)
+        )
+        if shared:
+            # The leader's thread accounts the tokens; this caller consumed none
+            self.last_usage = {}
+        return text
+
+    def _complete(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        response_format: str,
+        max_output_tokens: Optional[int],
+    ) -> Optional[str]:
+        self.last_usage = {}
         try:
             # Adapt Prompts
             system_prompt = None
@@ -59,17 +114,95 @@ class LLMGateway:
             generation_config = {"temperature": temperature}
             if response_format == "json_object":
                 generation_config["response_mime_type"] = "application/json"
+            if max_output_tokens:
+                generation_config["max_output_tokens"] = max_output_tokens
 
-            # Init Model with the auto-detected name
-            model = genai.GenerativeModel(
-                model_name=self.model_name,
-                system_instruction=system_prompt,
-                generation_config=generation_config
-            )
+            model, cached = self._build_model(system_prompt, generation_config)
+            call_class = f"out:{max_output_tokens or 'default'}"
 
-            response = model.generate_content(user_prompt)
-            return response.text if response.text else "{}"
+            start = time.monotonic()
+            try:
+                response = self._generate(model, user_prompt, call_class=call_class)
+            except Exception as e:
+                if not cached or self._is_throttled(e):
+                    raise
+                # The provider may have expired or deleted the cached prefix: drop it and resend inline
+                print(f"⚠️ Cached prompt rejected, retrying inline: {e}")
+                self.prompt_cache.invalidate(self.model_name, system_prompt)
+                model = self._inline_model(system_prompt, generation_config)
+                response = self._generate(model, user_prompt, call_class=call_class)
+            metrics.LLM_CALL_SECONDS.observe(time.monotonic() - start)
+            text = response.text if response.text else "{}"
+            self.last_usage = self._extract_usage(response, system_prompt, user_prompt, text)
+            return text
 
         except Exception as e:
+            reason = "throttled" if self._is_throttled(e) else "error"
+            metrics.LLM_ERRORS.labels(reason=reason).inc()
             print(f"❌ Gemini Error ({self.model_name}): {str(e)}")
-            return "{}"
\ No newline at end of file
+            return "{}"
+
+    def _build_model(self, system_prompt: Optional[str], generation_config: Dict) -> Tuple[Any, bool]:
+        """
+        Uses a cached system-prompt prefix when available, else sends it inline.
+        Returns (model, cached).
+        """
+        if self.prompt_cache and system_prompt:
+            handle = self.prompt_cache.lookup(self.model_name, system_prompt)
+            if handle is not None:
+                try:
+                    return self.prompt_cache.backend.build_model(handle, generation_config), True
+                except Exception as e:
+                    print(f"⚠️ Cached prompt unusable, sending inline: {e}")
+                    self.prompt_cache.invalidate(self.model_name, system_prompt)
+        return self._inline_model(system_prompt, generation_config), False
+
+    def _inline_model(self, system_prompt: Optional[str], generation_config: Dict):
+        # Init Model with the auto-detected name
+        return genai.GenerativeModel(
+            model_name=self.model_name,
+            system_instruction=system_prompt,
+            generation_config=generation_config
+        )
+
+    def _generate(self, model, user_prompt: str, call_class: str = "default"):
+        """
+        Runs one generation under the adaptive limiter.
+        Rate-limit errors shrink the limit and are retried with exponential backoff.
+        `call_class` groups calls of similar size for the limiter's latency signal.
+        """
+        for attempt in range(settings.LLM_MAX_RETRIES + 1):
+            with self.limiter.slot(call_class) as permit:
+                try:
+                    return model.generate_content(user_prompt)
+                except Exception as e:
+                    if not self._is_throttled(e):
+                        raise
+                    permit.throttled = True
+                    if attempt == settings.LLM_MAX_RETRIES:
+                        raise
+
+            metrics.LLM_RETRIES.inc()
+            delay = settings.LLM_RETRY_BACKOFF_SECONDS * (2 ** attempt)
+            print(f"⚠️ Rate limited ({self.model_name}); concurrency limit now {self.limiter.limit}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+    @staticmethod
+    def _is_throttled(error: Exception) -> bool:
+        """True for provider rate-limit / quota errors (HTTP 429)."""
+        if getattr(error, "code", None) == 429:
+            return True
+        return type(error).__name__ in ("ResourceExhausted", "TooManyRequests", "RateLimitError")
+
+    def _extract_usage(self, response, system_prompt: Optional[str], user_prompt: str, text: str) -> Dict[str, int]:
+        """Reads token counts from the response, estimating them if the provider omits them."""
+        meta = getattr(response, "usage_metadata", None)
+        if meta and getattr(meta, "prompt_token_count", None) is not None:
+            return {
+                "input_tokens": meta.prompt_token_count or 0,
+                "output_tokens": getattr(meta, "candidates_token_count", 0) or 0,
+            }
+        return {
+            "input_tokens": estimate_tokens(system_prompt) + estimate_tokens(user_prompt),
+            "output_tokens": estimate_tokens(text),
+        }
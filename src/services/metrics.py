@@ -0,0 +1,292 @@
+import threading
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from config.settings import settings
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+INF_LABEL = 'le="+Inf"'
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric(ABC):
+    """Base for labelled metrics; `labels(...)` returns a bound child."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def labels(self, **labels: str) -> "_Child":
+        return _Child(self, self._key(labels))
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """Sample lines in the text exposition format."""
+        pass
+
+
+class _Child:
+    def __init__(self, metric: _Metric, key: LabelValues):
+        self._metric = metric
+        self._key = key
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._metric._inc(self._key, amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._metric._inc(self._key, -amount)
+
+    def set(self, value: float) -> None:
+        self._metric._set(self._key, value)
+
+    def observe(self, value: float) -> None:
+        self._metric._observe(self._key, value)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._inc((), amount)
+
+    def _inc(self, key: LabelValues, amount: float) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_number(v)}" for k, v in items]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._function: Optional[Callable[[], float]] = None
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._inc((), amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._inc((), -amount)
+
+    def set(self, value: float) -> None:
+        self._set((), value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Reads the value from `function` at scrape time (unlabelled gauges only)."""
+        self._function = function
+
+    def _inc(self, key: LabelValues, amount: float) -> None:
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _set(self, key: LabelValues, value: float) -> None:
+        with self._lock:
+            self._values[key] = float(value)
+
+    def value(self, **labels: str) -> float:
+        if self._function is not None:
+            return float(self._function())
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        if self._function is not None:
+            return [f"{self.name} {_format_number(self._function())}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_number(v)}" for k, v in items]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> (per-bucket counts, sum, count)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float) -> None:
+        self._observe((), value)
+
+    def _observe(self, key: LabelValues, value: float) -> None:
+        with self._lock:
+            counts, total, count = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def count(self, **labels: str) -> int:
+        entry = self._values.get(self._key(labels))
+        return entry[2] if entry else 0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, (list(c), s, n)) for k, (c, s, n) in self._values.items())
+        lines = []
+        for key, (counts, total, count) in items:
+            for bound, bucket_count in zip(self.buckets, counts):
+                labels = _format_labels(self.labelnames, key, f'le="{_format_number(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {bucket_count}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, INF_LABEL)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_number(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Holds metrics and renders them in the Prometheus text exposition format.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Duplicate metric: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# ------------------ System Metrics ------------------ #
+WORKFLOWS_IN_FLIGHT = REGISTRY.register(Gauge(
+    "agentic_workflows_in_flight", "Workflows currently running in the orchestrator"))
+WORKFLOWS_COMPLETED = REGISTRY.register(Counter(
+    "agentic_workflows_completed_total", "Finished workflows by outcome", ["status"]))
+AGENT_STEP_SECONDS = REGISTRY.register(Histogram(
+    "agentic_agent_step_seconds", "Latency of one agent step", ["agent"]))
+AGENT_ERRORS = REGISTRY.register(Counter(
+    "agentic_agent_errors_total", "Agent steps that raised", ["agent"]))
+REVIEW_ITERATIONS = REGISTRY.register(Counter(
+    "agentic_review_loop_iterations_total", "Reviewer rejections that triggered a re-draft"))
+LLM_CALL_SECONDS = REGISTRY.register(Histogram(
+    "agentic_llm_call_seconds", "Latency of one provider call (including limiter wait)"))
+LLM_ERRORS = REGISTRY.register(Counter(
+    "agentic_llm_errors_total", "Failed provider calls", ["reason"]))
+LLM_RETRIES = REGISTRY.register(Counter(
+    "agentic_llm_retries_total", "Provider calls retried after throttling"))
+LLM_TOKENS = REGISTRY.register(Counter(
+    "agentic_llm_tokens_total", "Tokens consumed by agents", ["agent", "direction"]))
+SINGLE_FLIGHT = REGISTRY.register(Counter(
+    "agentic_single_flight_total", "Single-flight calls by layer and role (follower = deduplicated)", ["layer", "role"]))
+PROMPT_CACHE_EVENTS = REGISTRY.register(Counter(
+    "agentic_prompt_cache_events_total", "Prompt prefix cache events", ["event"]))
+PROMPT_CACHE_TOKENS_SAVED = REGISTRY.register(Counter(
+    "agentic_prompt_cache_tokens_saved_total", "Prefix tokens served from the provider cache instead of resent"))
+CACHE_LOOKUPS = REGISTRY.register(Counter(
+    "agentic_cache_lookups_total", "Artifact store lookups", ["result"]))
+SCHEDULER_QUEUE_DEPTH = REGISTRY.register(Gauge(
+    "agentic_scheduler_queue_depth", "Workflows waiting in the scheduler", ["priority"]))
+SCHEDULER_WAIT_SECONDS = REGISTRY.register(Histogram(
+    "agentic_scheduler_wait_seconds", "Time from submit to start", ["priority"]))
+LLM_CONCURRENCY_LIMIT = REGISTRY.register(Gauge(
+    "agentic_llm_concurrency_limit", "Current adaptive limit on in-flight LLM calls"))
+LLM_IN_FLIGHT = REGISTRY.register(Gauge(
+    "agentic_llm_in_flight", "LLM calls currently in flight"))
+LLM_QUEUE_DEPTH = REGISTRY.register(Gauge(
+    "agentic_llm_queue_depth", "Callers waiting for an LLM concurrency slot"))
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would flood the console
+        pass
+
+
+def start_metrics_server(port: Optional[int] = None, registry: MetricsRegistry = REGISTRY) -> Optional[ThreadingHTTPServer]:
+    """
+    Serves /metrics on localhost in a daemon thread.
+
+    Args:
+        port: Port to bind (0 picks a free port). Defaults to settings.METRICS_PORT,
+              in which case the endpoint only starts if ENABLE_METRICS is set.
+    Returns:
+        The running server, or None when disabled.
+    """
+    if port is None:
+        if not settings.ENABLE_METRICS:
+            return None
+        port = settings.METRICS_PORT
+
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+    server = ThreadingHTTPServer((settings.METRICS_HOST, port), handler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    print(f"📈 Metrics endpoint at http://{settings.METRICS_HOST}:{server.server_address[1]}/metrics")
+    return server
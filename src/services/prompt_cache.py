@@ -0,0 +1,228 @@
+import datetime
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from config.settings import settings
+from src.services import metrics
+from src.services.single_flight import SingleFlight
+from src.Utils.prompt_loader import prompt_version
+from src.Utils.token_budget import estimate_tokens
+
+
+class GeminiCacheBackend:
+    """
+    Gemini context caching (google.generativeai `CachedContent`).
+    """
+
+    def create(self, model_name: str, system_instruction: str, ttl_seconds: int) -> Tuple[Any, Optional[int]]:
+        """Registers a prefix. Returns (handle, cached token count if reported)."""
+        from google.generativeai import caching
+
+        cache = caching.CachedContent.create(
+            model=model_name,
+            system_instruction=system_instruction,
+            ttl=datetime.timedelta(seconds=ttl_seconds),
+        )
+        usage = getattr(cache, "usage_metadata", None)
+        return cache, getattr(usage, "total_token_count", None)
+
+    def refresh(self, handle: Any, ttl_seconds: int) -> None:
+        handle.update(ttl=datetime.timedelta(seconds=ttl_seconds))
+
+    def build_model(self, handle: Any, generation_config: Dict[str, Any]):
+        import google.generativeai as genai
+
+        return genai.GenerativeModel.from_cached_content(cached_content=handle, generation_config=generation_config)
+
+
+class LocalCacheBackend:
+    """
+    In-process stand-in for tests and dry runs.
+    Handles are plain dicts; models are built uncached from the stored prefix,
+    so responses match the real backend while registration/refresh are observable.
+    """
+
+    def __init__(self):
+        self.created = 0
+        self.refreshed = 0
+
+    def create(self, model_name: str, system_instruction: str, ttl_seconds: int) -> Tuple[Any, Optional[int]]:
+        self.created += 1
+        handle = {
+            "name": f"local/{self.created}",
+            "model": model_name,
+            "system_instruction": system_instruction,
+            "ttl_seconds": ttl_seconds,
+        }
+        return handle, None
+
+    def refresh(self, handle: Any, ttl_seconds: int) -> None:
+        self.refreshed += 1
+        handle["ttl_seconds"] = ttl_seconds
+
+    def build_model(self, handle: Any, generation_config: Dict[str, Any]):
+        import google.generativeai as genai
+
+        return genai.GenerativeModel(
+            model_name=handle["model"],
+            system_instruction=handle["system_instruction"],
+            generation_config=generation_config,
+        )
+
+
+class _Entry:
+    __slots__ = ("handle", "tokens", "expires_at", "uses")
+
+    def __init__(self, handle: Any, tokens: int, expires_at: float):
+        self.handle = handle
+        self.tokens = tokens
+        self.expires_at = expires_at
+        self.uses = 0
+
+
+class PromptCache:
+    """
+    Registry of provider-cached prompt prefixes.
+
+    Responsibilities:
+    - Register long, stable system prompts once per (model, prompt version, prefix)
+    - Refresh entries shortly before their TTL runs out
+    - Skip prefixes below the provider minimum, and remember failed registrations
+      for one TTL so they are not retried on every call
+    - Track reuse and tokens saved
+
+    With the default PROMPT_CACHE_MIN_TOKENS no prompt in config/prompts.yaml is
+    long enough to qualify (the extraction prompt is ~130 tokens), so every lookup
+    is skipped until a long, stable system prompt is added.
+    """
+
+    def __init__(
+        self,
+        backend: Any,
+        ttl_seconds: Optional[int] = None,
+        refresh_margin_seconds: Optional[int] = None,
+        min_tokens: Optional[int] = None,
+        prompts_version: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds or settings.PROMPT_CACHE_TTL_SECONDS
+        self.refresh_margin = settings.PROMPT_CACHE_REFRESH_MARGIN_SECONDS if refresh_margin_seconds is None else refresh_margin_seconds
+        self.min_tokens = settings.PROMPT_CACHE_MIN_TOKENS if min_tokens is None else min_tokens
+        self.prompts_version = prompts_version or prompt_version()
+        self.clock = clock
+
+        self._entries: Dict[str, _Entry] = {}
+        # key -> time until which registration is not retried
+        self._failed: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        # Per-key single-flight for registration/refresh round-trips
+        self._flight = SingleFlight("prompt_cache")
+        self._stats = {"registered": 0, "refreshed": 0, "reused": 0, "skipped": 0, "errors": 0, "tokens_saved": 0}
+
+    def key_for(self, model_name: str, prefix: str) -> str:
+        digest = hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:16]
+        return f"{model_name}:{self.prompts_version}:{digest}"
+
+    def lookup(self, model_name: str, prefix: str) -> Optional[Any]:
+        """
+        Returns a provider handle for `prefix`, registering or refreshing it as needed.
+        None means: send the prefix inline as usual.
+        """
+        if estimate_tokens(prefix) < self.min_tokens:
+            self._count("skipped")
+            return None
+
+        key = self.key_for(model_name, prefix)
+        now = self.clock()
+        with self._lock:
+            if self._failed.get(key, 0.0) > now:
+                return None
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                # Expired server-side already; register afresh
+                self._entries.pop(key)
+                entry = None
+
+        # Provider round-trips run outside the lock; concurrent callers for one key share a single call
+        if entry is None:
+            entry, shared = self._flight.do(key, lambda: self._register(key, model_name, prefix))
+            if entry is None or not shared:
+                return entry.handle if entry else None
+        elif entry.expires_at - now <= self.refresh_margin:
+            self._flight.do(key, lambda: self._refresh(entry))
+
+        with self._lock:
+            entry.uses += 1
+        self._count("reused")
+        self._count("tokens_saved", entry.tokens)
+        return entry.handle
+
+    def _register(self, key: str, model_name: str, prefix: str) -> Optional[_Entry]:
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > now:
+                # Registered by a call that finished just before this one started
+                return entry
+        try:
+            handle, tokens = self.backend.create(model_name, prefix, self.ttl_seconds)
+        except Exception as e:
+            print(f"⚠️ Prompt cache registration failed: {e}")
+            with self._lock:
+                self._failed[key] = now + self.ttl_seconds
+            self._count("errors")
+            return None
+        entry = _Entry(handle, tokens or estimate_tokens(prefix), now + self.ttl_seconds)
+        with self._lock:
+            self._entries[key] = entry
+        self._count("registered")
+        return entry
+
+    def _refresh(self, entry: _Entry) -> None:
+        now = self.clock()
+        if entry.expires_at - now > self.refresh_margin:
+            return  # Refreshed by a call that finished just before this one started
+        try:
+            self.backend.refresh(entry.handle, self.ttl_seconds)
+        except Exception as e:
+            print(f"⚠️ Prompt cache refresh failed: {e}")
+            self._count("errors")
+            return
+        with self._lock:
+            entry.expires_at = now + self.ttl_seconds
+        self._count("refreshed")
+
+    def invalidate(self, model_name: str, prefix: str) -> None:
+        """Drops an entry the provider no longer honours (e.g. expired server-side)."""
+        with self._lock:
+            self._entries.pop(self.key_for(model_name, prefix), None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, event: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[event] += amount
+        if event == "tokens_saved":
+            metrics.PROMPT_CACHE_TOKENS_SAVED.inc(amount)
+        else:
+            metrics.PROMPT_CACHE_EVENTS.labels(event=event).inc(amount)
+
+
+_shared_cache: Optional[PromptCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_prompt_cache() -> Optional[PromptCache]:
+    """Returns the process-wide Gemini prompt cache, or None when ENABLE_PROMPT_CACHE is off."""
+    global _shared_cache
+    if not settings.ENABLE_PROMPT_CACHE:
+        return None
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = PromptCache(GeminiCacheBackend())
+        return _shared_cache
@@ -1,8 +1,8 @@
-import json
 import time
 from typing import Dict, Optional, Any
 
 from config.settings import settings
+from src.Utils import json_codec
 
 
 class Telemetry:
@@ -39,7 +39,7 @@ class Telemetry:
 
         if data:
             try:
-                payload = f" | {json.dumps(data, default=str)}"
+                payload = f" | {json_codec.dumps(data, default=str)}"
             except Exception:
                 payload = " | <unserializable data>"
 
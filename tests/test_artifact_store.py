@@ -0,0 +1,63 @@
+from config.settings import settings
+from src.core.workflow_state import WorkflowState
+from src.core.orchestrator import Orchestrator
+from src.agents.base_agent import BaseAgent
+from src.agents.supervisor import SupervisorAgent
+from src.services.artifact_store import ArtifactStore
+
+# --- MOCKS ---
+
+class CountingDrafter(BaseAgent):
+    """Fills every stage in one step and counts how often it ran."""
+    def __init__(self):
+        super().__init__(agent_name="Drafter")
+        self.calls = 0
+
+    def process(self, state):
+        self.calls += 1
+        state.product_data = {"product_name": "Serum", "price": "$50"}
+        state.competitor_data = {"product_name": "Rival"}
+        state.generated_questions = ["Q1", "Q2", "Q3"]
+        state.product_page = {"title": "Serum", "content": "Nice"}
+        state.faq_page = {"questions": ["Q1", "Q2", "Q3"]}
+        state.comparison_page = {"us": "Serum", "them": "Rival"}
+        return state
+
+def _orchestrator(store, drafter):
+    registry = {name: drafter for name in ("ingestor", "researcher", "drafter")}
+    return Orchestrator(SupervisorAgent(llm_gateway=object()), registry, artifact_store=store)
+
+# --- UNIT TESTS: INCREMENTAL REGENERATION ---
+
+def test_unchanged_input_skips_agents(tmp_path, monkeypatch):
+    """Scenario: Same input, prompts and model on the second run. No agent runs."""
+    monkeypatch.chdir(tmp_path)
+    store = ArtifactStore(model_name="m1", root=str(tmp_path / "store"), prompts_version="v1")
+    drafter = CountingDrafter()
+
+    _orchestrator(store, drafter).run(WorkflowState(raw_input="Sell a  serum for $50."))
+    cached = _orchestrator(store, drafter).run(WorkflowState(raw_input="Sell a serum for $50. "))
+
+    assert drafter.calls == 1
+    assert store.hits == 1
+    assert cached.is_complete and cached.faq_page == {"questions": ["Q1", "Q2", "Q3"]}
+
+def test_prompt_or_model_change_invalidates(tmp_path):
+    """Scenario: The key changes with the prompt version or the model."""
+    state = WorkflowState(raw_input="Sell a serum")
+    base = ArtifactStore(model_name="m1", root=str(tmp_path), prompts_version="v1")
+
+    assert base.key_for(state) != ArtifactStore("m1", str(tmp_path), "v2").key_for(state)
+    assert base.key_for(state) != ArtifactStore("m2", str(tmp_path), "v1").key_for(state)
+
+def test_generation_settings_change_invalidates(tmp_path, monkeypatch):
+    """Scenario: FAQ count or token budgets change; stored pages are not reused."""
+    state = WorkflowState(raw_input="Sell a serum")
+    before = ArtifactStore("m1", str(tmp_path), "v1").key_for(state)
+
+    monkeypatch.setattr(settings, "FAQ_QUESTION_COUNT", 7)
+    assert ArtifactStore("m1", str(tmp_path), "v1").key_for(state) != before
+
+    monkeypatch.setattr(settings, "FAQ_QUESTION_COUNT", 5)
+    monkeypatch.setitem(settings.TOKEN_BUDGETS, "drafter", {"max_output_tokens": 64})
+    assert ArtifactStore("m1", str(tmp_path), "v1").key_for(state) != before
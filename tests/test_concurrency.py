@@ -0,0 +1,74 @@
+import threading
+import time
+
+from src.services.concurrency import AdaptiveLimiter
+
+# --- UNIT TESTS: AIMD CONTROL ---
+
+def test_healthy_calls_grow_limit():
+    """Scenario: Steady, fast calls raise the limit additively."""
+    limiter = AdaptiveLimiter(initial=2, max_limit=10)
+
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(latency=0.1)
+
+    assert limiter.limit > 2
+
+def test_throttling_halves_limit():
+    """Scenario: A 429 cuts the limit multiplicatively, never below the floor."""
+    limiter = AdaptiveLimiter(initial=8, min_limit=2)
+
+    with limiter.slot() as permit:
+        permit.throttled = True
+    assert limiter.limit == 4
+
+    for _ in range(5):
+        limiter.acquire()
+        limiter.release(throttled=True)
+    assert limiter.limit == 2
+    assert limiter.snapshot()["throttled_total"] == 6
+
+def test_latency_spike_shrinks_limit():
+    """Scenario: Latency far above baseline signals queueing at the provider."""
+    limiter = AdaptiveLimiter(initial=10, latency_tolerance=2.0)
+    limiter.acquire()
+    limiter.release(latency=0.1)
+    before = limiter._limit
+
+    limiter.acquire()
+    limiter.release(latency=1.0)
+
+    assert limiter._limit < before
+
+def test_mixed_call_sizes_do_not_shrink_limit():
+    """Scenario: Short and long healthy calls alternate without throttling."""
+    limiter = AdaptiveLimiter(initial=8, max_limit=16)
+
+    for _ in range(20):
+        for call_class, latency in (("out:512", 0.8), ("out:12288", 4.0)):
+            limiter.acquire()
+            limiter.release(latency=latency, call_class=call_class)
+
+    assert limiter.limit >= 8
+
+def test_in_flight_never_exceeds_limit():
+    """Scenario: Many threads share one limiter; concurrency stays capped."""
+    limiter = AdaptiveLimiter(initial=3, max_limit=3)
+    peak = []
+    lock = threading.Lock()
+
+    def call():
+        with limiter.slot():
+            with lock:
+                peak.append(limiter.in_flight)
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=call) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert max(peak) <= 3
+    assert limiter.in_flight == 0
@@ -0,0 +1,97 @@
+import json
+
+from config.settings import settings
+from src.core.workflow_state import WorkflowState
+from src.agents.drafter import DraftingAgent
+
+# --- MOCKS ---
+
+class ScriptedLLMGateway:
+    """Answers prompts with a callable so tests can inspect what was asked."""
+    def __init__(self, responder):
+        self.responder = responder
+        self.prompts = []
+        self.last_usage = {}
+
+    def chat_completion(self, messages, temperature=0.0, response_format="text", max_output_tokens=None):
+        prompt = messages[-1]["content"]
+        self.prompts.append(prompt)
+        self.last_usage = {"input_tokens": 40, "output_tokens": 10}
+        return self.responder(prompt)
+
+def _faqs(questions):
+    return [{"question": q, "answer": f"Answer to {q}"} for q in questions]
+
+def _state(name, questions):
+    return WorkflowState(
+        product_data={"product_name": name, "price": "$10"},
+        competitor_data={"product_name": "Rival"},
+        generated_questions=questions,
+    )
+
+# --- UNIT TESTS: FAQ ANSWERING ---
+
+def test_faq_answers_all_questions_in_one_call():
+    """Scenario: Every selected question is answered by a single LLM call."""
+    questions = ["Q1", "Q2", "Q3", "Q4", "Q5", "Q6"]
+    gateway = ScriptedLLMGateway(lambda prompt: json.dumps({"faqs": _faqs(questions[:5])}))
+    agent = DraftingAgent(llm_gateway=gateway)
+
+    state = agent.process(_state("Serum", questions))
+
+    assert len(gateway.prompts) == 1
+    assert state.faq_page["questions"] == questions[:5]
+    assert state.faq_page["faqs"][0] == {"question": "Q1", "answer": "Answer to Q1"}
+
+def test_batch_falls_back_for_malformed_items():
+    """Scenario: The batch call drops one product; only that product gets an individual call."""
+    def responder(prompt):
+        if "results" in prompt:
+            return json.dumps({"results": [
+                {"id": "0", "faqs": _faqs(["A1", "A2"])},
+                {"id": "1", "faqs": "not a list"},
+            ]})
+        return json.dumps({"faqs": _faqs(["B1", "B2"])})
+
+    gateway = ScriptedLLMGateway(responder)
+    agent = DraftingAgent(llm_gateway=gateway)
+
+    states = agent.draft_batch([_state("A", ["A1", "A2"]), _state("B", ["B1", "B2"])])
+
+    assert len(gateway.prompts) == 2
+    assert [f["question"] for f in states[0].faq_page["faqs"]] == ["A1", "A2"]
+    assert [f["question"] for f in states[1].faq_page["faqs"]] == ["B1", "B2"]
+
+def test_failed_answer_call_leaves_page_for_retry():
+    """Scenario: The answer call fails; no answerless page is emitted and the retry is bounded."""
+    agent = DraftingAgent(llm_gateway=ScriptedLLMGateway(lambda prompt: "{}"))
+    state = _state("Serum", ["Q1", "Q2", "Q3"])
+
+    agent.process(state)
+    assert state.faq_page is None
+    assert state.errors[-1].startswith("ReviewFeedback")
+
+    agent.process(state)
+    agent.process(state)
+    assert "ReviewFeedback" not in state.errors[-1]  # critical: the supervisor stops
+
+def test_batch_respects_output_ceiling_and_counts_one_call(monkeypatch):
+    """Scenario: Chunks shrink to fit the provider output ceiling; each call is counted once."""
+    monkeypatch.setattr(settings, "LLM_MAX_OUTPUT_TOKENS", 3072)
+    budgets = []
+
+    class BudgetGateway(ScriptedLLMGateway):
+        def chat_completion(self, messages, temperature=0.0, response_format="text", max_output_tokens=None):
+            budgets.append(max_output_tokens)
+            return super().chat_completion(messages, temperature, response_format, max_output_tokens)
+
+    def responder(prompt):
+        items = json.loads(prompt.split("Products: ", 1)[1].split("\n", 1)[0])
+        return json.dumps({"results": [{"id": i["id"], "faqs": _faqs(i["questions"])} for i in items]})
+
+    agent = DraftingAgent(llm_gateway=BudgetGateway(responder))
+    states = agent.draft_batch([_state(f"P{i}", ["Q1", "Q2"]) for i in range(4)])
+
+    assert all(b <= 3072 for b in budgets) and len(budgets) == 2
+    assert sum(s.token_usage["Drafter"]["calls"] for s in states) == 2
+    assert sum(s.token_usage["Drafter"]["input_tokens"] for s in states) == 80
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 from src.core.workflow_state import WorkflowState
 from src.core.orchestrator import Orchestrator
 from src.agents.supervisor import SupervisorAgent
+from src.agents.base_agent import BaseAgent
 from src.agents.reviewer import ReviewerAgent
 
 # --- MOCKS ---
@@ -105,7 +106,10 @@ def test_reviewer_passes_good_content():
     agent = ReviewerAgent()
     state = WorkflowState(
         product_page={"content": "Good stuff"},
-        faq_page={"questions": ["Q1", "Q2", "Q3"]},
+        faq_page={
+            "questions": ["Q1", "Q2", "Q3"],
+            "faqs": [{"question": q, "answer": "Yes."} for q in ("Q1", "Q2", "Q3")],
+        },
         comparison_page={"table": ["data"]}
     )
     
@@ -124,4 +128,43 @@ def test_supervisor_stops_on_critical_error():
     new_state = agent.process(state)
     
     assert new_state.is_complete is True
-    assert new_state.next_agent == "FINISH"
\ No newline at end of file
+    assert new_state.next_agent == "FINISH"
+# --- INTEGRATION TEST: REVIEW GATE ---
+
+def test_orchestrator_routes_drafts_through_reviewer(tmp_path, monkeypatch):
+    """Scenario: An answerless FAQ page is rejected by the real reviewer and re-drafted."""
+    monkeypatch.chdir(tmp_path)
+
+    class FakeWorker(BaseAgent):
+        """Fills its own pipeline stage like the real agents do (never touching last_agent)."""
+        def __init__(self, role):
+            super().__init__(agent_name=role)
+            self.role = role
+            self.drafts = 0
+
+        def process(self, state):
+            if self.role == "ingestor":
+                state.product_data = {"product_name": "Serum", "price": "$50"}
+            elif self.role == "researcher":
+                state.competitor_data = {"product_name": "Rival"}
+                state.generated_questions = ["Q1", "Q2", "Q3"]
+            else:
+                self.drafts += 1
+                answers = [] if self.drafts == 1 else [{"question": q, "answer": "Yes."} for q in ("Q1", "Q2", "Q3")]
+                state.product_page = {"title": "Serum", "price": "$50", "content": "Nice"}
+                state.faq_page = {"questions": ["Q1", "Q2", "Q3"], "faqs": answers}
+                state.comparison_page = {"us": "Serum", "them": "Rival"}
+            return state
+
+    drafter = FakeWorker("drafter")
+    registry = {
+        "ingestor": FakeWorker("ingestor"), "researcher": FakeWorker("researcher"),
+        "drafter": drafter, "reviewer": ReviewerAgent(),
+    }
+
+    state = Orchestrator(SupervisorAgent(llm_gateway=MockLLMGateway()), registry).run(WorkflowState(raw_input="x"))
+
+    assert state.is_complete and state.last_agent == "reviewer"
+    assert drafter.drafts == 2
+    assert len(state.faq_page["faqs"]) == 3
+    assert [e for e in state.errors if "ReviewFeedback" in e] == ["ReviewFeedback: FAQ page has unanswered questions."]
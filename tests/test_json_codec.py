@@ -0,0 +1,59 @@
+import pytest
+
+from src.core.workflow_state import WorkflowState
+from src.agents.data_ingestion import DataIngestionAgent
+from src.schemas.product_data import ProductData
+from src.Utils import json_codec
+
+# --- FIXTURES ---
+
+@pytest.fixture(params=json_codec.available_backends())
+def backend(request):
+    """Runs a test once per installed backend, restoring the default afterwards."""
+    previous = json_codec.get_backend()
+    json_codec.set_backend(request.param)
+    yield request.param
+    json_codec.set_backend(previous)
+
+class StaticLLMGateway:
+    def __init__(self, response):
+        self.response = response
+        self.last_usage = {}
+
+    def chat_completion(self, messages, temperature=0.0, response_format="text", max_output_tokens=None):
+        return self.response
+
+# --- UNIT TESTS: CODEC ---
+
+def test_roundtrip_compact_and_pretty(backend):
+    """Scenario: Every backend round-trips data; pretty output is indented, compact is not."""
+    data = {"product_name": "Sérum", "benefits": ["Glow"], "price": "$50"}
+
+    compact = json_codec.dumps(data)
+    pretty = json_codec.dumps(data, pretty=True)
+
+    assert json_codec.loads(compact) == data
+    assert json_codec.loads(pretty.encode("utf-8")) == data
+    assert "\n" not in compact and "\n  " in pretty
+
+def test_default_handles_unserializable(backend):
+    """Scenario: Telemetry-style payloads fall back to str() for unknown types."""
+    assert json_codec.loads(json_codec.dumps({"obj": object}, default=str))["obj"].startswith("<class")
+
+def test_decode_model_from_bytes():
+    """Scenario: ProductData validates straight from bytes, applying its null handling."""
+    model = json_codec.decode_model(b'{"product_name": "Serum", "price": "$50", "skin_type": null}', ProductData)
+
+    assert model.product_name == "Serum"
+    assert model.skin_type == "Not specified"
+
+# --- UNIT TESTS: INGESTION ---
+
+def test_ingestion_validates_raw_json_text():
+    """Scenario: Fenced LLM output is cleaned and validated without an intermediate dict."""
+    agent = DataIngestionAgent(llm_gateway=StaticLLMGateway('```json\n{"product_name": "Serum", "price": "$50"}\n```'))
+
+    state = agent.process(WorkflowState(raw_input="Sell a serum for $50"))
+
+    assert state.errors == []
+    assert state.product_data["price"] == "$50"
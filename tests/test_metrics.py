@@ -0,0 +1,86 @@
+import urllib.request
+
+from src.core.workflow_state import WorkflowState
+from src.core.orchestrator import Orchestrator
+from src.agents.base_agent import BaseAgent
+from src.agents.supervisor import SupervisorAgent
+from src.services.metrics import REVIEW_ITERATIONS, Counter, Histogram, MetricsRegistry, start_metrics_server
+
+# --- UNIT TESTS: EXPOSITION ---
+
+def test_render_counters_and_histograms():
+    """Scenario: Metrics render in the Prometheus text format."""
+    registry = MetricsRegistry()
+    errors = registry.register(Counter("test_errors_total", "Errors", ["reason"]))
+    latency = registry.register(Histogram("test_latency_seconds", "Latency", buckets=(0.1, 1.0)))
+
+    errors.labels(reason="throttled").inc()
+    errors.labels(reason="throttled").inc()
+    latency.observe(0.5)
+
+    text = registry.render()
+
+    assert '# TYPE test_errors_total counter' in text
+    assert 'test_errors_total{reason="throttled"} 2' in text
+    assert 'test_latency_seconds_bucket{le="0.1"} 0' in text
+    assert 'test_latency_seconds_bucket{le="1"} 1' in text
+    assert 'test_latency_seconds_bucket{le="+Inf"} 1' in text
+    assert 'test_latency_seconds_count 1' in text
+
+def test_http_endpoint_serves_metrics():
+    """Scenario: Operators scrape /metrics from a running batch."""
+    registry = MetricsRegistry()
+    registry.register(Counter("test_workflows_total", "Workflows")).inc(3)
+    server = start_metrics_server(port=0, registry=registry)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        body = urllib.request.urlopen(url, timeout=5).read().decode("utf-8")
+    finally:
+        server.shutdown()
+
+    assert "test_workflows_total 3" in body
+
+def test_review_iterations_count_only_reviewer_rejections(tmp_path, monkeypatch):
+    """Scenario: One rejection followed by later drafter/reviewer steps counts once."""
+    monkeypatch.chdir(tmp_path)
+
+    class Research(BaseAgent):
+        def __init__(self):
+            super().__init__(agent_name="Research")
+
+        def process(self, state):
+            state.product_data = {"product_name": "Serum"}
+            state.competitor_data = {"product_name": "Rival"}
+            state.generated_questions = ["Q1"]
+            return state
+
+    class Drafter(BaseAgent):
+        def __init__(self):
+            super().__init__(agent_name="Drafter")
+
+        def process(self, state):
+            state.product_page = {"content": "Nice"}
+            state.faq_page = {"questions": ["Q1"]}
+            state.comparison_page = {"them": "Rival"}
+            return state
+
+    class Reviewer(BaseAgent):
+        def __init__(self):
+            super().__init__(agent_name="Reviewer")
+            self.reviews = 0
+
+        def process(self, state):
+            self.reviews += 1
+            if self.reviews == 1:
+                state.add_error("ReviewFeedback: too short")
+                state.product_page = None
+            return state
+
+    research = Research()
+    registry = {"ingestor": research, "researcher": research, "drafter": Drafter(), "reviewer": Reviewer()}
+    before = REVIEW_ITERATIONS.value()
+
+    state = Orchestrator(SupervisorAgent(llm_gateway=object()), registry).run(WorkflowState(raw_input="x"))
+
+    assert state.is_complete
+    assert REVIEW_ITERATIONS.value() - before == 1
@@ -0,0 +1,141 @@
+import threading
+import time
+
+from src.services.concurrency import AdaptiveLimiter
+from src.services.llm_gateway import LLMGateway
+from src.services.prompt_cache import LocalCacheBackend, PromptCache
+from src.services.single_flight import SingleFlight
+
+LONG_PREFIX = "You are a Data Extraction Engine. Follow the schema exactly. " * 80
+
+# --- MOCKS ---
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class FailingBackend(LocalCacheBackend):
+    def create(self, model_name, system_instruction, ttl_seconds):
+        self.created += 1
+        raise RuntimeError("Cached content is too small")
+
+def _cache(backend=None, clock=None, version="v1"):
+    return PromptCache(
+        backend or LocalCacheBackend(),
+        ttl_seconds=600,
+        refresh_margin_seconds=60,
+        min_tokens=100,
+        prompts_version=version,
+        clock=clock or FakeClock(),
+    )
+
+# --- UNIT TESTS: PREFIX CACHE ---
+
+def test_prefix_registered_once_then_reused():
+    """Scenario: Every ingestion call resends the same extraction prompt."""
+    backend = LocalCacheBackend()
+    cache = _cache(backend)
+
+    handles = [cache.lookup("models/gemini", LONG_PREFIX) for _ in range(5)]
+
+    assert backend.created == 1
+    assert all(h is handles[0] for h in handles)
+    stats = cache.stats()
+    assert stats["registered"] == 1 and stats["reused"] == 4
+    assert stats["tokens_saved"] == 4 * (len(LONG_PREFIX) // 4)
+
+def test_short_prefix_sent_inline():
+    """Scenario: Prefixes below the provider minimum are not cached."""
+    backend = LocalCacheBackend()
+    cache = _cache(backend)
+
+    assert cache.lookup("models/gemini", "Return JSON.") is None
+    assert backend.created == 0
+
+def test_refresh_before_expiry_and_reregister_after():
+    """Scenario: Entries are extended inside the refresh margin and re-created once expired."""
+    backend, clock = LocalCacheBackend(), FakeClock()
+    cache = _cache(backend, clock)
+    cache.lookup("models/gemini", LONG_PREFIX)
+
+    clock.now = 570  # 30s left, inside the 60s margin
+    cache.lookup("models/gemini", LONG_PREFIX)
+    assert backend.refreshed == 1
+
+    clock.now = 570 + 601  # past the extended TTL
+    cache.lookup("models/gemini", LONG_PREFIX)
+    assert backend.created == 2
+
+def test_prompt_version_is_part_of_key():
+    """Scenario: Editing prompts.yaml yields a new cache entry."""
+    assert _cache(version="v1").key_for("m", LONG_PREFIX) != _cache(version="v2").key_for("m", LONG_PREFIX)
+
+def test_failed_registration_not_retried_every_call():
+    """Scenario: The provider rejects a prefix; calls fall back inline without hammering it."""
+    backend = FailingBackend()
+    cache = _cache(backend)
+
+    assert cache.lookup("models/gemini", LONG_PREFIX) is None
+    assert cache.lookup("models/gemini", LONG_PREFIX) is None
+    assert backend.created == 1
+    assert cache.stats()["errors"] == 1
+
+def test_slow_registration_does_not_block_other_prefixes():
+    """Scenario: One prefix is being registered; other prefixes and callers are not serialized behind it."""
+    release = threading.Event()
+
+    class SlowBackend(LocalCacheBackend):
+        def create(self, model_name, system_instruction, ttl_seconds):
+            if system_instruction == LONG_PREFIX:
+                release.wait(timeout=5)
+            return super().create(model_name, system_instruction, ttl_seconds)
+
+    backend = SlowBackend()
+    cache = _cache(backend)
+    slow = [threading.Thread(target=cache.lookup, args=("models/gemini", LONG_PREFIX)) for _ in range(3)]
+    for t in slow:
+        t.start()
+    time.sleep(0.05)
+
+    start = time.monotonic()
+    other = cache.lookup("models/gemini", LONG_PREFIX + " Other.")
+    waited = time.monotonic() - start
+
+    release.set()
+    for t in slow:
+        t.join()
+    assert other is not None and waited < 1
+    assert backend.created == 2  # one registration per prefix, shared by the three callers
+    assert cache.stats()["registered"] == 2 and cache.stats()["reused"] == 2
+
+def test_gateway_invalidates_and_retries_inline_when_cache_is_gone(monkeypatch):
+    """Scenario: The provider dropped the cached content; the call succeeds inline and the entry is re-registered."""
+    class Response:
+        text = '{"ok": true}'
+        usage_metadata = None
+
+    class DeadModel:
+        def generate_content(self, prompt):
+            raise RuntimeError("403 CachedContent not found")
+
+    class InlineModel:
+        def generate_content(self, prompt):
+            return Response()
+
+    class DeadHandleBackend(LocalCacheBackend):
+        def build_model(self, handle, generation_config):
+            return DeadModel()
+
+    monkeypatch.setenv("GEMINI_API_KEY", "fake")
+    monkeypatch.setattr(LLMGateway, "_find_working_model", lambda self: "models/gemini")
+    monkeypatch.setattr(LLMGateway, "_inline_model", lambda self, system_prompt, config: InlineModel())
+    backend = DeadHandleBackend()
+    gateway = LLMGateway(limiter=AdaptiveLimiter(), single_flight=SingleFlight("test"), prompt_cache=_cache(backend))
+    messages = [{"role": "system", "content": LONG_PREFIX}, {"role": "user", "content": "Serum"}]
+
+    assert gateway.chat_completion(messages) == '{"ok": true}'
+    gateway.chat_completion(messages + [{"role": "user", "content": "again"}])
+    assert backend.created == 2
@@ -0,0 +1,86 @@
+import time
+
+import pytest
+
+from src.core.workflow_state import WorkflowState
+from src.core.quality_rules import PageQualityChecker, load_rules, validate_saved_artifacts
+from src.Utils.file_manager import ArtifactSaver
+
+# --- HELPERS ---
+
+def _good_state(name="Serum", price="$50"):
+    return WorkflowState(
+        product_data={"product_name": name, "price": price},
+        product_page={"title": name, "price": price, "content": "Good stuff"},
+        faq_page={
+            "questions": ["Q1", "Q2", "Q3"],
+            "faqs": [{"question": q, "answer": "Yes."} for q in ("Q1", "Q2", "Q3")],
+        },
+        comparison_page={"us": name, "them": "Rival"},
+    )
+
+# --- UNIT TESTS: RULES ---
+
+def test_batch_report_flags_each_page_independently():
+    """Scenario: A batch mixes good pages, duplicate questions and a price mismatch."""
+    checker = PageQualityChecker()
+    duplicate = _good_state()
+    duplicate.faq_page["questions"] = ["Is it safe?", "is it  safe?", "Q3"]
+    mismatch = _good_state()
+    mismatch.product_page["price"] = "$99"
+
+    reports = checker.check_batch([_good_state(), duplicate, mismatch])
+
+    assert [r.passed for r in reports] == [True, False, False]
+    assert reports[1].issues[0].rule == "unique"
+    assert reports[2].issues[0].page == "product_page"
+    assert "does not match" in reports[2].issues[0].message
+
+def test_faq_page_without_answers_fails():
+    """Scenario: The answer call failed, leaving questions but no answers."""
+    state = _good_state()
+    state.faq_page["faqs"] = []
+
+    report = PageQualityChecker().check(state)
+
+    assert not report.passed
+    assert [i.rule for i in report.issues] == ["answered"]
+
+def test_rule_set_never_loads_empty(tmp_path, monkeypatch):
+    """Scenario: The reviewer must not fail open when rules are missing or empty."""
+    monkeypatch.chdir(tmp_path)
+    assert load_rules()  # default path does not depend on the working directory
+
+    with pytest.raises(FileNotFoundError):
+        load_rules(str(tmp_path / "missing.yaml"))
+    empty = tmp_path / "empty.yaml"
+    empty.write_text("faq_page: []\n")
+    with pytest.raises(ValueError):
+        load_rules(str(empty))
+
+def test_batch_of_thousands_runs_fast():
+    """Scenario: Catalog-scale QA finishes well within seconds."""
+    checker = PageQualityChecker()
+    states = [_good_state(name=f"Serum {i}") for i in range(5000)]
+
+    start = time.perf_counter()
+    reports = checker.check_batch(states)
+
+    assert all(r.passed for r in reports)
+    assert time.perf_counter() - start < 5
+
+def test_validates_saved_artifacts_offline(tmp_path):
+    """Scenario: Artifacts on disk are re-validated without the workflow that made them."""
+    ArtifactSaver.save_artifacts(_good_state(), output_dir=str(tmp_path / "serum"))
+    broken = _good_state()
+    broken.comparison_page = None
+    ArtifactSaver.save_artifacts(broken, output_dir=str(tmp_path / "broken"))
+    mismatch = _good_state()
+    mismatch.product_page["price"] = "$99"
+    ArtifactSaver.save_artifacts(mismatch, output_dir=str(tmp_path / "mismatch"))
+
+    reports = validate_saved_artifacts([str(tmp_path / p) for p in ("serum", "broken", "mismatch")])
+
+    assert reports[0].page_id == "serum" and reports[0].passed
+    assert [i.message for i in reports[1].issues] == ["Comparison page is missing."]
+    assert [i.rule for i in reports[2].issues] == ["matches_product"]
@@ -0,0 +1,108 @@
+import time
+
+from src.core.workflow_state import WorkflowState
+from src.core.scheduler import RequestScheduler
+from src.schemas.requests import UserRequest
+
+# --- MOCKS ---
+
+class RecordingOrchestrator:
+    def __init__(self, order):
+        self.order = order
+
+    def run(self, state):
+        self.order.append(state.raw_input)
+        state.is_complete = True
+        return state
+
+class SaturatedLimiter:
+    """Every LLM slot is taken and callers are already waiting."""
+    def __init__(self):
+        self.limit = 4
+        self.in_flight = 4
+        self.waiting = 2
+
+def _scheduler(order, **kwargs):
+    return RequestScheduler(lambda: RecordingOrchestrator(order), workers=1, reserved_interactive=0, **kwargs)
+
+# --- UNIT TESTS: ORDERING ---
+
+def test_interactive_jumps_ahead_of_bulk():
+    """Scenario: A merchandiser request arrives behind a queued catalog batch."""
+    order = []
+    scheduler = _scheduler(order)
+    for i in range(3):
+        scheduler.submit(WorkflowState(raw_input=f"bulk-{i}"))
+    future = scheduler.submit(UserRequest(user_input="ad-hoc"))
+
+    scheduler.start()
+    future.result(timeout=5)
+    scheduler.shutdown()
+
+    assert order[0] == "ad-hoc"
+    assert order[1:] == ["bulk-0", "bulk-1", "bulk-2"]
+
+def test_weighted_fair_sharing_between_tenants():
+    """Scenario: Tenant 'a' has twice the weight of 'b'; both have a backlog."""
+    order = []
+    scheduler = _scheduler(order, tenant_weights={"a": 2.0, "b": 1.0})
+    for i in range(6):
+        scheduler.submit(WorkflowState(raw_input=f"a-{i}"), tenant="a")
+        scheduler.submit(WorkflowState(raw_input=f"b-{i}"), tenant="b")
+
+    scheduler.start()
+    scheduler.shutdown()
+
+    first_six = [name[0] for name in order[:6]]
+    assert first_six.count("a") == 4 and first_six.count("b") == 2
+
+# --- UNIT TESTS: ADMISSION CONTROL ---
+
+def test_bulk_held_while_llm_saturated():
+    """Scenario: LLM calls are queueing; bulk waits but interactive still runs."""
+    order = []
+    limiter = SaturatedLimiter()
+    scheduler = _scheduler(order, limiter=limiter).start()
+    scheduler.submit(WorkflowState(raw_input="bulk"))
+    scheduler.submit(UserRequest(user_input="ad-hoc")).result(timeout=5)
+    time.sleep(0.2)
+
+    assert order == ["ad-hoc"]
+    assert scheduler.queue_depth()["bulk"] == 1
+
+    limiter.in_flight = limiter.waiting = 0
+    scheduler.shutdown()
+    assert order == ["ad-hoc", "bulk"]
+
+# --- UNIT TESTS: REPORTS ---
+
+def test_each_job_gets_its_own_report_path(tmp_path):
+    """Scenario: Concurrent workflows must not write the same run report."""
+    paths = []
+
+    class ReportingOrchestrator(RecordingOrchestrator):
+        report_path = "run_report.md"
+
+        def run(self, state):
+            paths.append(self.report_path)
+            return super().run(state)
+
+    scheduler = RequestScheduler(
+        lambda: ReportingOrchestrator([]), workers=2, reserved_interactive=0, report_dir=str(tmp_path)
+    ).start()
+    futures = [scheduler.submit(WorkflowState(raw_input=f"bulk-{i}")) for i in range(4)]
+    scheduler.shutdown()
+
+    assert all(f.result().is_complete for f in futures)
+    assert len(set(paths)) == 4
+    assert all(p.startswith(str(tmp_path)) for p in paths)
+
+def test_single_worker_still_runs_bulk():
+    """Scenario: One worker with the default interactive reservation; bulk must not starve forever."""
+    order = []
+    scheduler = RequestScheduler(lambda: RecordingOrchestrator(order), workers=1, reserved_interactive=1).start()
+    future = scheduler.submit(WorkflowState(raw_input="bulk"))
+
+    assert future.result(timeout=5).is_complete
+    scheduler.shutdown()
+    assert scheduler.max_bulk_running == 1
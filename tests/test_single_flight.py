@@ -0,0 +1,91 @@
+import threading
+import time
+
+from src.core.workflow_state import WorkflowState
+from src.core.orchestrator import Orchestrator
+from src.agents.base_agent import BaseAgent
+from src.agents.supervisor import SupervisorAgent
+from src.services.single_flight import SingleFlight
+
+# --- MOCKS ---
+
+class SlowDrafter(BaseAgent):
+    """Completes every stage after a delay, so concurrent runs overlap."""
+    def __init__(self):
+        super().__init__(agent_name="Drafter")
+        self.calls = 0
+
+    def process(self, state):
+        self.calls += 1
+        time.sleep(0.2)
+        state.product_data = {"product_name": "Serum", "price": "$50"}
+        state.competitor_data = {"product_name": "Rival"}
+        state.generated_questions = ["Q1", "Q2", "Q3"]
+        state.product_page = {"content": "Nice"}
+        state.faq_page = {"questions": ["Q1", "Q2", "Q3"]}
+        state.comparison_page = {"them": "Rival"}
+        state.record_token_usage("Drafter", {"input_tokens": 40, "output_tokens": 20})
+        return state
+
+def _run_concurrently(fn, count):
+    results = [None] * count
+    def worker(i):
+        results[i] = fn(i)
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+# --- UNIT TESTS: SINGLE FLIGHT ---
+
+def test_concurrent_identical_calls_execute_once():
+    """Scenario: Five callers ask for the same key at once; one execution is fanned out."""
+    group = SingleFlight("test")
+    executions = []
+
+    def compute():
+        executions.append(1)
+        time.sleep(0.1)
+        return "answer"
+
+    results = _run_concurrently(lambda i: group.do("same", compute), 5)
+
+    assert len(executions) == 1
+    assert {r[0] for r in results} == {"answer"}
+    assert sorted(r[1] for r in results) == [False, True, True, True, True]
+    assert group.stats() == {"executed": 1, "shared": 4}
+
+def test_duplicate_listings_share_one_workflow(tmp_path, monkeypatch):
+    """Scenario: The same serum listed in three regions (whitespace differs) runs the agents once."""
+    monkeypatch.chdir(tmp_path)
+    group = SingleFlight("workflow")
+    drafter = SlowDrafter()
+    registry = {name: drafter for name in ("ingestor", "researcher", "drafter")}
+    inputs = ["Sell a serum for $50.", "Sell a  serum for $50. ", "Sell a serum\nfor $50."]
+
+    def run(i):
+        orchestrator = Orchestrator(SupervisorAgent(llm_gateway=object()), registry, single_flight=group)
+        return orchestrator.run(WorkflowState(raw_input=inputs[i]))
+
+    states = _run_concurrently(run, 3)
+
+    assert drafter.calls == 1
+    assert all(s.faq_page == {"questions": ["Q1", "Q2", "Q3"]} for s in states)
+    assert len({id(s) for s in states}) == 3
+    assert "In-Flight Deduplication" in (tmp_path / "run_report.md").read_text(encoding="utf-8")
+    # Only the leader spent tokens; followers must not double-count them
+    assert sum(s.token_usage.get("Drafter", {}).get("input_tokens", 0) for s in states) == 40
+
+def test_report_shows_dedupe_of_its_own_run(tmp_path, monkeypatch):
+    """Scenario: A later run's report does not repeat earlier runs' process-wide totals."""
+    monkeypatch.chdir(tmp_path)
+    group = SingleFlight("workflow")
+    registry = {name: SlowDrafter() for name in ("ingestor", "researcher", "drafter")}
+
+    for text in ("Sell a serum", "Sell a cream"):
+        Orchestrator(SupervisorAgent(llm_gateway=object()), registry, single_flight=group).run(WorkflowState(raw_input=text))
+
+    assert group.stats()["executed"] == 2
+    assert "| workflow | 1 | 0 |" in (tmp_path / "run_report.md").read_text(encoding="utf-8")
@@ -0,0 +1,57 @@
+import json
+
+from src.core.workflow_state import WorkflowState
+from src.agents.researcher import ResearchAgent
+from src.Utils.token_budget import build_prompt_context, estimate_tokens
+
+# --- MOCKS ---
+
+class RecordingLLMGateway:
+    """Returns canned JSON and remembers the kwargs of every call."""
+    def __init__(self, response="{}"):
+        self.response = response
+        self.calls = []
+        self.last_usage = {}
+
+    def chat_completion(self, messages, temperature=0.0, response_format="text", max_output_tokens=None):
+        self.calls.append({"messages": messages, "max_output_tokens": max_output_tokens})
+        self.last_usage = {"input_tokens": 100, "output_tokens": 20}
+        return self.response
+
+# --- UNIT TESTS: PROMPT CONTEXT ---
+
+def test_prompt_context_selects_fields():
+    """Scenario: Only the requested fields reach the prompt."""
+    data = {"product_name": "Serum", "price": "$50", "how_to_use": "Daily"}
+
+    context = json.loads(build_prompt_context(data, fields=["product_name", "price"]))
+
+    assert context == {"product_name": "Serum", "price": "$50"}
+
+def test_prompt_context_respects_budget():
+    """Scenario: A bloated listing is trimmed to the token budget."""
+    data = {
+        "product_name": "Serum",
+        "benefits": [f"Benefit number {i} " * 10 for i in range(50)],
+        "how_to_use": "Apply " * 500,
+    }
+
+    text = build_prompt_context(data, max_tokens=100)
+
+    assert estimate_tokens(text) <= 100
+    assert json.loads(text)["product_name"] == "Serum"
+
+# --- UNIT TESTS: RESEARCHER BUDGETS ---
+
+def test_researcher_passes_budget_and_records_usage():
+    """Scenario: Research calls carry max_output_tokens and are accounted on the state."""
+    gateway = RecordingLLMGateway(response='{"questions": ["Q1"]}')
+    agent = ResearchAgent(llm_gateway=gateway)
+    state = WorkflowState(product_data={"product_name": "Serum", "price": "$50"})
+
+    new_state = agent.process(state)
+
+    assert all(call["max_output_tokens"] for call in gateway.calls)
+    usage = new_state.token_usage["Researcher"]
+    assert usage["calls"] == 2
+    assert usage["input_tokens"] == 200